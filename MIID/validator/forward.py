@@ -59,6 +59,9 @@ from MIID.utils.misc import upload_data
 EPOCH_MIN_TIME = 360  # seconds
 MIID_SERVER = "http://52.44.186.20:5000/upload_data" ## MIID server
 
+# Sentinel for getattr lookups that must tell a missing attribute apart from None
+_MISSING = object()
+
 async def dendrite_with_retries(dendrite: bt.Dendrite, axons: list, synapse: IdentitySynapse,
                                 deserialize: bool, timeout: float, cnt_attempts=3):
     """
@@ -103,9 +106,10 @@ async def dendrite_with_retries(dendrite: bt.Dendrite, axons: list, synapse: Ide
             #bt.logging.info(f"#########################################Response type: {type(response)}#########################################")
             
             process_time = None
-            if hasattr(response, "dendrite") and hasattr(response.dendrite, "process_time"):
+            raw_process_time = getattr(getattr(response, "dendrite", None), "process_time", None)
+            if raw_process_time is not None:
                 try:
-                    process_time = float(response.dendrite.process_time)
+                    process_time = float(raw_process_time)
                 except (ValueError, TypeError):
                     process_time = None
                         
@@ -187,14 +191,17 @@ def process_new_variations_structure(uid_response_map, miner_uids, self, expecte
 
     for uid in miner_uids:
         response = uid_response_map.get(uid)
-        if not response or not hasattr(response, "variations") or response.variations is None:
+        if not response:
+            continue
+        variations = getattr(response, "variations", None)
+        if variations is None:
             continue
 
         miner_variations = {}
         miner_uav_data = {"uavs": {}, "valid_count": 0, "has_coordinates": False}
 
         try:
-            items = response.variations.items() if isinstance(response.variations, dict) else []
+            items = variations.items() if isinstance(variations, dict) else []
             for seed_name, seed_data in items:
                 if isinstance(seed_data, list):
                     # Old format: variations only
@@ -389,14 +396,15 @@ async def forward(self):
             uid = batch_uids[idx_resp]
             uid_response_map[uid] = response
             
-            if not hasattr(response, 'variations'):
+            variations = getattr(response, 'variations', _MISSING)
+            if variations is _MISSING:
                 bt.logging.warning(f"Miner {uid} returned response without 'variations' attribute.")
-            elif response.variations is None:
+            elif variations is None:
                 bt.logging.warning(f"Miner {uid} returned None in 'variations'.")
-            elif not response.variations:
+            elif not variations:
                 bt.logging.warning(f"Miner {uid} returned empty variations dictionary.")
             else:
-                total_variations = sum(len(v) for v in response.variations.values())
+                total_variations = sum(len(v) for v in variations.values())
                 # Enhanced logging for name structure validation
                 # for name, variations in response.variations.items():
                 #     name_parts = name.split()
@@ -440,7 +448,7 @@ async def forward(self):
     bt.logging.info(f"Received identity variation responses for {len(all_responses)} miners")
     valid_responses = 0
     for i, response in enumerate(all_responses):
-        if hasattr(response, 'variations') and response.variations:
+        if getattr(response, 'variations', None):
             valid_responses += 1
         else:
             bt.logging.warning(f"Miner {miner_uids[i]} returned invalid or empty response")
@@ -605,14 +613,17 @@ async def forward(self):
             }
             
             # Add variations if available
-            if hasattr(response, 'variations') and response.variations is not None:
-                response_data["variations"] = response.variations
+            variations = getattr(response, 'variations', None)
+            if variations is not None:
+                response_data["variations"] = variations
             else:
                 # Log error information if available
-                if hasattr(response, 'dendrite') and hasattr(response.dendrite, 'status_code'):
+                dendrite = getattr(response, 'dendrite', None)
+                status_code = getattr(dendrite, 'status_code', None)
+                if status_code is not None:
                     response_data["error"] = {
-                        "status_code": response.dendrite.status_code,
-                        "status_message": getattr(response.dendrite, 'status_message', 'Unknown error')
+                        "status_code": status_code,
+                        "status_message": getattr(dendrite, 'status_message', 'Unknown error')
                     }
                 else:
                     response_data["error"] = {
@@ -5,22 +5,98 @@ from typing import Dict, Any, Tuple, List, Optional
 import os
 import re
 import json
+import time
+from functools import lru_cache
+
+# orjson decodes the (small, numerous) Ollama judge payloads noticeably faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Make sure this import is outside any function or conditional blocks
 from faker import Faker  # Ensure this is always imported
 import geonamescache
 
+def _loads(text: str) -> Any:
+    """Decode an Ollama JSON payload, preferring orjson and falling back to json."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN, huge ints); let json have the final say
+            pass
+    return json.loads(text)
+
+@lru_cache(maxsize=None)
+def _get_ollama_client(host: str, timeout: Optional[float]) -> ollama.Client:
+    """
+    Shared Ollama client per (host, timeout), so generation, judge and repair calls
+    reuse one HTTP connection pool instead of building a new client every attempt.
+    ollama.Client only takes its timeout at construction; the keys are bounded by the
+    configured hosts and timeout ladders, so clients are never evicted or closed mid-stream.
+    ollama.Client (httpx underneath) is safe to share across threads.
+    """
+    return ollama.Client(host=host, timeout=timeout)
+
+def _stream_judge_response(client: ollama.Client, model: str, prompt: str, timeout: Optional[float] = None) -> str:
+    """
+    Stream a judge completion. When the reply starts with a bare JSON object, stop reading
+    as soon as that object closes instead of waiting for any trailing commentary.
+    When streaming, the client timeout only bounds the gap between chunks, so `timeout`
+    is also enforced as an overall deadline; exceeding it raises TimeoutError.
+    """
+    parts: List[str] = []
+    depth = 0
+    in_string = escaped = False
+    direct_json: Optional[bool] = None
+    deadline = time.monotonic() + timeout if timeout else None
+    stream = client.generate(model=model, prompt=prompt, stream=True)
+    try:
+        for chunk in stream:
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Judge model {model} timed out after {timeout}s")
+            piece = chunk.get('response', '')
+            parts.append(piece)
+            if direct_json is False:
+                continue
+            for i, ch in enumerate(piece):
+                if direct_json is None:
+                    if ch.isspace():
+                        continue
+                    direct_json = ch == '{'
+                    if not direct_json:
+                        break
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == '{':
+                    depth += 1
+                elif ch == '}':
+                    depth -= 1
+                    if depth == 0:
+                        parts[-1] = piece[:i + 1]
+                        return ''.join(parts).strip()
+    finally:
+        close = getattr(stream, 'close', None)
+        if close is not None:
+            close()
+    return ''.join(parts).strip()
+
+
 # --- Hint formatting helpers ---
 def _dedupe_list(items: List[str] | None) -> List[str]:
     if not items:
         return []
-    seen: set[str] = set()
-    ordered: List[str] = []
-    for it in items:
-        if it not in seen:
-            ordered.append(it)
-            seen.add(it)
-    return ordered
+    # dicts keep insertion order, so this is an order-preserving dedup in one C-level pass
+    return list(dict.fromkeys(items))
 
 def _append_hint_section(template: str, tag: str, items: List[str]) -> str:
     items = _dedupe_list(items)
@@ -88,19 +164,19 @@ def _run_judge_model(
     variation_count: int,
     rule_pct_val: int,
     rule_descs_list: List[str],
-    ambiguity_sentence: str
+    ambiguity_sentence: str,
+    timeout: Optional[float] = None
 ) -> Tuple[List[str], Dict[str, Any]]:
     """Helper to run a single judge model call and parse the output."""
     text = ""
     parsed = None
     llm_issues = []
     
-    resp = client.generate(model=model, prompt=prompt)
-    text = resp.get('response', '').strip()
+    text = _stream_judge_response(client, model, prompt, timeout)
     
     # Try multiple JSON extraction strategies
     try:
-        parsed = json.loads(text)
+        parsed = _loads(text)
         llm_issues.append("Strategy 1 (Direct JSON): SUCCESS")
     except json.JSONDecodeError as e:
         llm_issues.append(f"Strategy 1 (Direct JSON): FAILED - {str(e)}")
@@ -109,7 +185,7 @@ def _run_judge_model(
         code_block_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
         if code_block_match:
             try:
-                parsed = json.loads(code_block_match.group(1))
+                parsed = _loads(code_block_match.group(1))
                 llm_issues.append("Strategy 2 (Markdown Code Block): SUCCESS")
             except json.JSONDecodeError as e:
                 llm_issues.append(f"Strategy 2 (Markdown Code Block): FAILED - {str(e)}")
@@ -119,7 +195,7 @@ def _run_judge_model(
             json_match = re.search(r'\{[^{}]*"present"[^{}]*\{[\s\S]*?\}\s*\}', text, re.DOTALL)
             if json_match:
                 try:
-                    parsed = json.loads(json_match.group(0))
+                    parsed = _loads(json_match.group(0))
                     llm_issues.append("Strategy 3 (Pattern Match): SUCCESS")
                 except json.JSONDecodeError as e:
                     llm_issues.append(f"Strategy 3 (Pattern Match): FAILED - {str(e)}")
@@ -133,7 +209,7 @@ def _run_judge_model(
             llm_issues.append(f"Strategy 4 (General JSON): Found {len(json_objects)} potential JSON objects")
             for i, obj_str in enumerate(json_objects):
                 try:
-                    temp_parsed = json.loads(obj_str)
+                    temp_parsed = _loads(obj_str)
                     if isinstance(temp_parsed, dict) and 'present' in temp_parsed:
                         parsed = temp_parsed
                         llm_issues.append(f"Strategy 4 (General JSON): SUCCESS with object {i+1}")
@@ -796,7 +872,7 @@ class QueryGenerator:
             nonlocal judge_success, llm_issues, successful_judge_model, successful_judge_timeout
             try:
                 bt.logging.info(f"🔍 Attempting judge with model: {model} and timeout: {timeout}s")
-                client = ollama.Client(host=neuron_cfg.ollama_url, timeout=timeout)
+                client = _get_ollama_client(neuron_cfg.ollama_url, timeout)
                 
                 # Provide the judge with structured expectations, asking it to mark what is missing.
                 judge_prompt = (
@@ -836,7 +912,8 @@ class QueryGenerator:
                 issues, _ = _run_judge_model(
                     client, model, judge_prompt, self.judge_strict_mode,
                     soft_issue_map, phonetic_expected_tokens, orthographic_expected_tokens,
-                    variation_count, rule_pct_val, rule_descs_list, ambiguity_sentence
+                    variation_count, rule_pct_val, rule_descs_list, ambiguity_sentence,
+                    timeout=timeout
                 )
                 
                 llm_issues = issues
@@ -1144,7 +1221,7 @@ class QueryGenerator:
                 try:
                     bt.logging.debug(f"🤖 Attempting to generate query with model: {model} and timeout: {timeout}s")
                     # Configure the client with the timeout
-                    client = ollama.Client(host=self.config.neuron.ollama_url, timeout=timeout)
+                    client = _get_ollama_client(self.config.neuron.ollama_url, timeout)
                     # Generate the query using Ollama
                     response = client.generate(model=model, prompt=prompt)
                     query_template = response['response'].strip()
@@ -1169,7 +1246,7 @@ class QueryGenerator:
                         if getattr(self.config.neuron, 'enable_repair_prompt', False):
                             try:
                                 bt.logging.info("🛠️  Attempting one-shot repair of invalid template using repair prompt")
-                                repair_client = ollama.Client(host=self.config.neuron.ollama_url, timeout=self.config.neuron.ollama_request_timeout)
+                                repair_client = _get_ollama_client(self.config.neuron.ollama_url, self.config.neuron.ollama_request_timeout)
                                 
                                 # Combine static and LLM-judged issues for a comprehensive repair prompt
                                 all_issues_for_repair = deduped_issues
@@ -5,6 +5,7 @@ import requests
 import json
 import numpy as np
 from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
 import ollama
 
 # %%
@@ -40,6 +41,10 @@ def Get_Respond_LLM_Local(prompt, Model):
 
 
 # %%
+# removes the numbering digits LLMs put in front of names
+DIGIT_TABLE = str.maketrans('', '', '0123456789')
+
+
 def Clean_extra(payload, comma, line, space):
     # a function to process the  LLMs output
     payload = payload.replace(".", "")
@@ -66,8 +71,7 @@ def Process_function(string, debug):
     # the case that we have nice comma seperated 
     if len(payload.split(","))>10:
         payload = Clean_extra(payload, False, True, True)
-        for num in range(10):
-            payload = payload.replace(str(num), "")
+        payload = payload.translate(DIGIT_TABLE)
         name_list = list(payload.split(",")[1:11])
         # remove repated setance, and hallucinations  
         Cleaned_name_list = []
@@ -93,8 +97,7 @@ def Process_function(string, debug):
         len_ans = len(payload.split("\\n"))
         if len_ans >2: # multiple lines, I will use this to seprate the names
             payload = Clean_extra(payload, True, False, True)
-            for num in range(10): #llm itarates with number instead of comma
-                payload = payload.replace(str(num), "")
+            payload = payload.translate(DIGIT_TABLE) #llm itarates with number instead of comma
             name_list = list(payload.split("\\n"))[0:10]
             Cleaned_name_list = []
             for name in name_list:
@@ -115,8 +118,7 @@ def Process_function(string, debug):
         # just itirated withouth the comma and only by numbers, so I will use empty space as a sep
         #' 1. Lilac  2. Lillie  3. Lyra  4. Lily-Jayne  5. Lis-Lis  6. Liliana  7. Lilis  8. Lillian  9. Lylla  10. Lylyla\\n',
             payload = Clean_extra(payload, True, True, False)
-            for num in range(10): #llm itarates with number instead of comma
-                payload = payload.replace(str(num), "")
+            payload = payload.translate(DIGIT_TABLE) #llm itarates with number instead of comma
                 
             name_list = list(payload.split(" ")) # we get more than 10
             
@@ -315,18 +317,23 @@ print(query_template)
 # %%
 
 # Generate variations using LLM
+# Format the query with each name
+formatted_queries = [query_template.replace("{name}", name) for name in names_list]
+
+# The prompts are independent, so send them concurrently and let the Ollama server
+# schedule them together (up to OLLAMA_NUM_PARALLEL); map keeps the name order
+with ThreadPoolExecutor(max_workers=4) as executor:
+    name_responds = list(tqdm(
+        executor.map(lambda formatted_query: Get_Respond_LLM(formatted_query, Model), formatted_queries),
+        total=len(formatted_queries)
+    ))
+
 Response_list = []
-for name in tqdm(names_list):
+for name, name_respond in zip(names_list, name_responds):
     Response_list.append("Respond")
     Response_list.append("---")
     Response_list.append("Query-" + name)
     Response_list.append("---")
-    
-    # Format the query with the current name
-    formatted_query = query_template.replace("{name}", name)
-    
-    # Query the LLM
-    name_respond = Get_Respond_LLM(formatted_query, Model)
     Response_list.append(name_respond)
 
 # Save raw responses to file (optional)
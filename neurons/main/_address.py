@@ -4,6 +4,7 @@ import json
 import os
 import sys
 import time
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
@@ -384,6 +385,13 @@ def get_real_street_names_for_country(country: str) -> List[str]:
     # Return empty list if not found (will use fallback)
     return []
 
+# Street-type words that mark a display_name segment as a road, matched in one scan
+_STREET_WORD_RE = re.compile(r'street|road|avenue')
+# "123 Some Street" -> number, street
+_NUMBERED_STREET_RE = re.compile(r'^(\d+)\s+(.+?)$')
+# First standalone number in a display_name segment (house number)
+_HOUSE_NUMBER_RE = re.compile(r'\b(\d+)\b')
+
 def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20) -> List[str]:
     """
     Query Nominatim API for real addresses in a specific city/country.
@@ -492,10 +500,10 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
                     # Check if first part looks like a street name (not a number, not too short)
                     if len(first_part) > 3 and not first_part.replace(' ', '').isdigit():
                         # Try to extract street name (might have number prefix)
-                        street_match = re.match(r'^(\d+)\s+(.+?)$', first_part)
+                        street_match = _NUMBERED_STREET_RE.match(first_part)
                         if street_match:
                             road = street_match.group(2).strip()
-                        elif 'street' in first_part.lower() or 'road' in first_part.lower() or 'avenue' in first_part.lower():
+                        elif _STREET_WORD_RE.search(first_part.lower()):
                             road = first_part
             
             # If we have a road/street name, format the address
@@ -506,7 +514,7 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
                 house_number = address_details.get('house_number', '')
                 if not house_number and display_name:
                     # Try to extract number from display_name
-                    number_match = re.search(r'\b(\d+)\b', display_name.split(',')[0])
+                    number_match = _HOUSE_NUMBER_RE.search(display_name.split(',', 1)[0])
                     if number_match:
                         house_number = number_match.group(1)
                 
@@ -538,12 +546,12 @@ def get_real_addresses_from_nominatim(city: str, country: str, limit: int = 20)
         print(f"⚠️  Warning: Failed to fetch real addresses from Nominatim for {city}, {country}: {str(e)}")
         return []
 
-def generate_address_variations(address: str, count: int = 15) -> List[str]:
+@lru_cache(maxsize=256)
+def _resolve_city_pool(address: str):
     """
-    Generate address variations - uses real city names from geonamescache when available.
-    
-    CRITICAL FIX: Validates cities against geonamescache to ensure they pass
-    validator's extract_city_country and city_in_country checks (Address Regain Match score).
+    Resolve (original_country, normalized_country, city_pool) for a seed address.
+    Validating the country's cities against geonamescache is the expensive part of address
+    generation, so the result is shared by every seed (and the UAV seed) with the same address.
     """
     # Extract city/country from address - preserve EXACT country name format
     parts = address.split(',')
@@ -597,116 +605,140 @@ def generate_address_variations(address: str, count: int = 15) -> List[str]:
                 else:
                     city_pool = ["City"]  # Absolute last resort
     
+    return original_country, normalized_country, tuple(city_pool)
+
+# Building numbers for generated addresses (range indexes like a list, without building one)
+_BUILDING_NUMBERS = range(1, 999)
+# Generic streets used when the database has nothing for the country
+_GENERIC_STREET_NAMES = ("Main St", "Oak Ave", "Park Rd", "Elm St", "First Ave",
+                         "Second St", "Broadway", "Washington Ave", "Lincoln St")
+# Longer generic streets for UAV addresses, so they clear the 30-character minimum
+_GENERIC_UAV_STREETS = ("Main Street", "Oak Avenue", "Elm Boulevard", "Park Drive", "First Avenue",
+                        "Second Street", "Third Boulevard", "Washington Avenue", "Lincoln Street")
+
+def generate_address_variations(address: str, count: int = 15) -> List[str]:
+    """
+    Generate address variations - uses real city names from geonamescache when available.
+    
+    CRITICAL FIX: Validates cities against geonamescache to ensure they pass
+    validator's extract_city_country and city_in_country checks (Address Regain Match score).
+    """
+    original_country, normalized_country, city_pool = _resolve_city_pool(address)
+    
     variations = []
     used = set()
     
     # Get real street names from hardcoded database for this country
     real_street_names = get_real_street_names_for_country(normalized_country)
     
-    # Determine if we should use real street names or fallback to generic
-    has_real_streets = len(real_street_names) > 0
-    
-    if has_real_streets:
-        # Use real street names from hardcoded database
-        # Generate addresses: "number street, city, country"
-        building_numbers = list(range(1, 999))
+    # Use real street names from hardcoded database, falling back to generic
+    # street names if the database doesn't have this country
+    street_pool = real_street_names if real_street_names else _GENERIC_STREET_NAMES
+    
+    # Generate addresses: "number street, city, country"
+    # The ", country" tail is the same for every address, so build it once
+    country_suffix = f", {normalized_country}"
+    # Draw every street/number/city up front rather than three choice() calls per address
+    for street, number, city in zip(random.choices(street_pool, k=count),
+                                    random.choices(_BUILDING_NUMBERS, k=count),
+                                    random.choices(city_pool, k=count)):
+        addr = f"{number} {street}, {city}{country_suffix}"
         
-        for i in range(count):
-            street = random.choice(real_street_names)
-            number = random.choice(building_numbers)
-            city = random.choice(city_pool)
-            
-            addr = f"{number} {street}, {city}, {normalized_country}"
-            
-            if addr not in used:
-                variations.append(addr)
-                used.add(addr)
-            else:
-                # Add apartment number if duplicate
-                apt = random.randint(1, 999)
-                addr = f"{number} {street}, Apt {apt}, {city}, {normalized_country}"
-                variations.append(addr)
-                used.add(addr)
-    else:
-        # Fallback to generic street names if database doesn't have this country
-        street_names = ["Main St", "Oak Ave", "Park Rd", "Elm St", "First Ave", 
-                        "Second St", "Broadway", "Washington Ave", "Lincoln St"]
-        building_numbers = list(range(1, 999))
-        
-        for i in range(count):
-            street = random.choice(street_names)
-            number = random.choice(building_numbers)
-            city = random.choice(city_pool)
-            
-            addr = f"{number} {street}, {city}, {normalized_country}"
-            
-            if addr not in used:
-                variations.append(addr)
-                used.add(addr)
-            else:
-                # Add apartment number if duplicate
-                apt = random.randint(1, 999)
-                addr = f"{number} {street}, Apt {apt}, {city}, {normalized_country}"
-                variations.append(addr)
-                used.add(addr)
+        if addr in used:
+            # Add apartment number if duplicate
+            apt = random.randint(1, 999)
+            addr = f"{number} {street}, Apt {apt}, {city}{country_suffix}"
+        variations.append(addr)
+        used.add(addr)
     
     return variations[:count]
 
+# Realistic coordinates per country (approximate), used by generate_uav_address
+# Comprehensive country database with geographic centers
+# These are rough approximations - in production, use geocoding API
+_COUNTRY_COORDS = {
+    # North America
+    "USA": (39.8283, -98.5795), "United States": (39.8283, -98.5795),
+    "US": (39.8283, -98.5795), "United States of America": (39.8283, -98.5795),
+    "Canada": (56.1304, -106.3468), "Mexico": (23.6345, -102.5528),
+    # Central America & Caribbean
+    "Haiti": (18.9712, -72.2852), "Honduras": (15.2000, -86.2419),
+    "Cuba": (21.5218, -77.7812), "Jamaica": (18.1096, -77.2975),
+    "Guatemala": (15.7835, -90.2308), "Belize": (17.1899, -88.4976),
+    "El Salvador": (13.7942, -88.8965), "Nicaragua": (12.2650, -85.2072),
+    "Costa Rica": (9.7489, -83.7534), "Panama": (8.5380, -80.7821),
+    "Dominican Republic": (18.7357, -70.1627), "Puerto Rico": (18.2208, -66.5901),
+    # South America
+    "Brazil": (-14.2350, -51.9253), "Argentina": (-38.4161, -63.6167),
+    "Colombia": (4.5709, -74.2973), "Peru": (-9.1900, -75.0152),
+    "Venezuela": (6.4238, -66.5897), "Chile": (-35.6751, -71.5430),
+    "Ecuador": (-1.8312, -78.1834), "Bolivia": (-16.2902, -63.5887),
+    "Paraguay": (-23.4425, -58.4438), "Uruguay": (-32.5228, -55.7658),
+    # Europe
+    "UK": (54.7024, -3.2766), "United Kingdom": (54.7024, -3.2766),
+    "Britain": (54.7024, -3.2766), "Great Britain": (54.7024, -3.2766),
+    "Germany": (51.1657, 10.4515), "France": (46.2276, 2.2137),
+    "Spain": (40.4637, -3.7492), "Italy": (41.8719, 12.5674),
+    "Russia": (61.5240, 105.3188), "Poland": (51.9194, 19.1451),
+    "Netherlands": (52.1326, 5.2913), "Belgium": (50.5039, 4.4699),
+    "Greece": (39.0742, 21.8243), "Portugal": (39.3999, -8.2245),
+    "Sweden": (60.1282, 18.6435), "Norway": (60.4720, 8.4689),
+    "Denmark": (56.2639, 9.5018), "Finland": (61.9241, 25.7482),
+    "Switzerland": (46.8182, 8.2275), "Austria": (47.5162, 14.5501),
+    "Czech Republic": (49.8175, 15.4730), "Romania": (45.9432, 24.9668),
+    "Hungary": (47.1625, 19.5033), "Ukraine": (48.3794, 31.1656),
+    "Turkey": (38.9637, 35.2433), "Ireland": (53.4129, -8.2439),
+    # Asia
+    "China": (35.8617, 104.1954), "India": (20.5937, 78.9629),
+    "Japan": (36.2048, 138.2529), "South Korea": (35.9078, 127.7669),
+    "North Korea": (40.3399, 127.5101), "Thailand": (15.8700, 100.9925),
+    "Vietnam": (14.0583, 108.2772), "Philippines": (12.8797, 121.7740),
+    "Indonesia": (-0.7893, 113.9213), "Malaysia": (4.2105, 101.9758),
+    "Singapore": (1.3521, 103.8198), "Bangladesh": (23.6850, 90.3563),
+    "Pakistan": (30.3753, 69.3451), "Afghanistan": (33.9391, 67.7100),
+    "Iran": (32.4279, 53.6880), "Iraq": (33.2232, 43.6793),
+    "Saudi Arabia": (23.8859, 45.0792), "UAE": (23.4241, 53.8478),
+    "United Arab Emirates": (23.4241, 53.8478), "Israel": (31.0461, 34.8516),
+    "Lebanon": (33.8547, 35.8623), "Jordan": (30.5852, 36.2384),
+    "Syria": (34.8021, 38.9968), "Yemen": (15.5527, 48.5164),
+    # Africa
+    "Egypt": (26.8206, 30.8025), "Libya": (26.3351, 17.2283),
+    "Sudan": (12.8628, 30.2176), "Ethiopia": (9.1450, 38.7667),
+    "Kenya": (-0.0236, 37.9062), "Nigeria": (9.0820, 8.6753),
+    "South Africa": (-30.5595, 22.9375), "Ghana": (7.9465, -1.0232),
+    "Morocco": (31.7917, -7.0926), "Algeria": (28.0339, 1.6596),
+    "Tunisia": (33.8869, 9.5375), "Mauritius": (-20.3484, 57.5522),
+    "Gabon": (-0.8037, 11.6094), "Benin": (9.3077, 2.3158),
+    "Namibia": (-22.9576, 18.4904), "Papua New Guinea": (-6.3150, 143.9555),
+    # Additional sanctioned countries
+    "South Sudan": (6.8770, 31.3070), "Central African Republic": (6.6111, 20.9394),
+    "Democratic Republic of the Congo": (-4.0383, 21.7587), "DRC": (-4.0383, 21.7587),
+    "Congo, Democratic Republic of the": (-4.0383, 21.7587), "Mali": (17.5707, -3.9962),
+    "Angola": (-11.2027, 17.8739), "Burkina Faso": (12.2383, -1.5616),
+    "Cameroon": (7.3697, 12.3547), "Ivory Coast": (7.5400, -5.5471),
+    "Cote d'Ivoire": (7.5400, -5.5471), "British Virgin Islands": (18.4207, -64.6399),
+    "Monaco": (43.7384, 7.4246), "Mozambique": (-18.6657, 35.5296),
+    "Myanmar": (21.9162, 95.9560), "Laos": (19.8563, 102.4955),
+    "Nepal": (28.3949, 84.1240), "Somalia": (5.1521, 46.1996),
+    # Additional Cyrillic sanctioned regions
+    "Belarus": (53.7098, 27.9534), "Bulgaria": (42.7339, 25.4858),
+    "Crimea": (45.3388, 33.5000), "Donetsk": (48.0159, 37.8029),
+    "Luhansk": (48.5740, 39.3078),
+    # Oceania
+    "Australia": (-25.2744, 133.7751), "New Zealand": (-40.9006, 174.8860),
+    # Middle East (already listed above, keeping for organization)
+    "Kuwait": (29.3117, 47.4818), "Qatar": (25.3548, 51.1839),
+    "Bahrain": (25.9304, 50.6378), "Oman": (21.4735, 55.9754),
+}
+# Lower-cased keys computed once for the per-call substring matching (dict order preserved)
+_COUNTRY_COORDS_LOWER = tuple((country_key.lower(), coords) for country_key, coords in _COUNTRY_COORDS.items())
+
 def generate_uav_address(address: str) -> Dict:
     """
     Generate UAV (Unknown Attack Vector) address that looks valid but might fail geocoding.
     Returns: dict with 'address', 'label', 'latitude', 'longitude'
     """
-    # Extract city/country from address (same logic as generate_address_variations)
-    parts = address.split(',')
-    original_country = None
-    seed_city = None
-    
-    if len(parts) >= 2:
-        seed_city = parts[0].strip()
-        original_country = parts[-1].strip()
-    else:
-        # No comma: validator sent just country name
-        original_country = address.strip() if address.strip() else "Unknown"
-    
-    # Normalize country name for geonamescache lookup (same as generate_address_variations)
-    normalized_country = normalize_country_name(original_country)
-    
-    # Get cities for this country - BUT validate they exist in geonamescache
-    if seed_city and validate_city_in_country(seed_city, normalized_country):
-        # If seed city is valid, use it
-        city_pool = [seed_city]
-    else:
-        # Get all cities for this country and filter to only validated ones
-        all_cities = get_cities_for_country(normalized_country)
-        # Filter to only cities that pass validator's city_in_country check
-        city_pool = [city for city in all_cities if validate_city_in_country(city, normalized_country)]
-        
-        # If no validated cities found, try fallback cities from well-known database
-        if not city_pool:
-            fallback_cities = get_fallback_cities(original_country)
-            if fallback_cities:
-                # Try to validate fallback cities against geonamescache
-                validated_fallbacks = [city for city in fallback_cities if validate_city_in_country(city, normalized_country)]
-                if validated_fallbacks:
-                    city_pool = validated_fallbacks
-                else:
-                    # Use fallback cities even if not validated (better than "City")
-                    city_pool = fallback_cities
-            else:
-                # Last resort: try to use first word of country name or a generic name
-                # Extract a meaningful word from country name instead of "City"
-                country_words = normalized_country.split()
-                if len(country_words) > 0:
-                    # Use first significant word (skip "the", "of", etc.)
-                    significant_words = [w for w in country_words if w.lower() not in ["the", "of", "and", "republic", "democratic"]]
-                    if significant_words:
-                        fallback_name = significant_words[0].capitalize()
-                        city_pool = [fallback_name]
-                    else:
-                        city_pool = ["City"]  # Absolute last resort
-                else:
-                    city_pool = ["City"]  # Absolute last resort
+    original_country, normalized_country, city_pool = _resolve_city_pool(address)
     
     # Select a random city from the pool
     city = random.choice(city_pool)
@@ -770,11 +802,7 @@ def generate_uav_address(address: str) -> Dict:
         # CRITICAL: All options must have street name + city + country format
         # CRITICAL: All options must be >= 30 characters to pass validator validation
         # Use longer generic street names to ensure minimum length
-        generic_street_options = [
-            "Main Street", "Oak Avenue", "Elm Boulevard", "Park Drive", "First Avenue",
-            "Second Street", "Third Boulevard", "Washington Avenue", "Lincoln Street"
-        ]
-        street = random.choice(generic_street_options)
+        street = random.choice(_GENERIC_UAV_STREETS)
         
         uav_options = [
             (f"{num} {street} Str, {city}, {normalized_country}", "Common typo (Str vs St)"),
@@ -789,7 +817,7 @@ def generate_uav_address(address: str) -> Dict:
         addr_len = len(''.join(c for c in uav_address if c.isalnum()))
         if addr_len < 30:
             # Fallback to longest generic street name
-            longest_street = max(generic_street_options, key=len)
+            longest_street = max(_GENERIC_UAV_STREETS, key=len)
             uav_address = f"{num} {longest_street} Str, {city}, {normalized_country}"
             label = "Common typo (Str vs St)"
             
@@ -800,91 +828,13 @@ def generate_uav_address(address: str) -> Dict:
                 label = "Common typo (Str vs St)"
     
     # Generate realistic coordinates based on country (approximate)
-    # Comprehensive country database with geographic centers
-    # These are rough approximations - in production, use geocoding API
-    country_coords = {
-        # North America
-        "USA": (39.8283, -98.5795), "United States": (39.8283, -98.5795),
-        "US": (39.8283, -98.5795), "United States of America": (39.8283, -98.5795),
-        "Canada": (56.1304, -106.3468), "Mexico": (23.6345, -102.5528),
-        # Central America & Caribbean
-        "Haiti": (18.9712, -72.2852), "Honduras": (15.2000, -86.2419),
-        "Cuba": (21.5218, -77.7812), "Jamaica": (18.1096, -77.2975),
-        "Guatemala": (15.7835, -90.2308), "Belize": (17.1899, -88.4976),
-        "El Salvador": (13.7942, -88.8965), "Nicaragua": (12.2650, -85.2072),
-        "Costa Rica": (9.7489, -83.7534), "Panama": (8.5380, -80.7821),
-        "Dominican Republic": (18.7357, -70.1627), "Puerto Rico": (18.2208, -66.5901),
-        # South America
-        "Brazil": (-14.2350, -51.9253), "Argentina": (-38.4161, -63.6167),
-        "Colombia": (4.5709, -74.2973), "Peru": (-9.1900, -75.0152),
-        "Venezuela": (6.4238, -66.5897), "Chile": (-35.6751, -71.5430),
-        "Ecuador": (-1.8312, -78.1834), "Bolivia": (-16.2902, -63.5887),
-        "Paraguay": (-23.4425, -58.4438), "Uruguay": (-32.5228, -55.7658),
-        # Europe
-        "UK": (54.7024, -3.2766), "United Kingdom": (54.7024, -3.2766),
-        "Britain": (54.7024, -3.2766), "Great Britain": (54.7024, -3.2766),
-        "Germany": (51.1657, 10.4515), "France": (46.2276, 2.2137),
-        "Spain": (40.4637, -3.7492), "Italy": (41.8719, 12.5674),
-        "Russia": (61.5240, 105.3188), "Poland": (51.9194, 19.1451),
-        "Netherlands": (52.1326, 5.2913), "Belgium": (50.5039, 4.4699),
-        "Greece": (39.0742, 21.8243), "Portugal": (39.3999, -8.2245),
-        "Sweden": (60.1282, 18.6435), "Norway": (60.4720, 8.4689),
-        "Denmark": (56.2639, 9.5018), "Finland": (61.9241, 25.7482),
-        "Switzerland": (46.8182, 8.2275), "Austria": (47.5162, 14.5501),
-        "Czech Republic": (49.8175, 15.4730), "Romania": (45.9432, 24.9668),
-        "Hungary": (47.1625, 19.5033), "Ukraine": (48.3794, 31.1656),
-        "Turkey": (38.9637, 35.2433), "Ireland": (53.4129, -8.2439),
-        # Asia
-        "China": (35.8617, 104.1954), "India": (20.5937, 78.9629),
-        "Japan": (36.2048, 138.2529), "South Korea": (35.9078, 127.7669),
-        "North Korea": (40.3399, 127.5101), "Thailand": (15.8700, 100.9925),
-        "Vietnam": (14.0583, 108.2772), "Philippines": (12.8797, 121.7740),
-        "Indonesia": (-0.7893, 113.9213), "Malaysia": (4.2105, 101.9758),
-        "Singapore": (1.3521, 103.8198), "Bangladesh": (23.6850, 90.3563),
-        "Pakistan": (30.3753, 69.3451), "Afghanistan": (33.9391, 67.7100),
-        "Iran": (32.4279, 53.6880), "Iraq": (33.2232, 43.6793),
-        "Saudi Arabia": (23.8859, 45.0792), "UAE": (23.4241, 53.8478),
-        "United Arab Emirates": (23.4241, 53.8478), "Israel": (31.0461, 34.8516),
-        "Lebanon": (33.8547, 35.8623), "Jordan": (30.5852, 36.2384),
-        "Syria": (34.8021, 38.9968), "Yemen": (15.5527, 48.5164),
-        # Africa
-        "Egypt": (26.8206, 30.8025), "Libya": (26.3351, 17.2283),
-        "Sudan": (12.8628, 30.2176), "Ethiopia": (9.1450, 38.7667),
-        "Kenya": (-0.0236, 37.9062), "Nigeria": (9.0820, 8.6753),
-        "South Africa": (-30.5595, 22.9375), "Ghana": (7.9465, -1.0232),
-        "Morocco": (31.7917, -7.0926), "Algeria": (28.0339, 1.6596),
-        "Tunisia": (33.8869, 9.5375), "Mauritius": (-20.3484, 57.5522),
-        "Gabon": (-0.8037, 11.6094), "Benin": (9.3077, 2.3158),
-        "Namibia": (-22.9576, 18.4904), "Papua New Guinea": (-6.3150, 143.9555),
-        # Additional sanctioned countries
-        "South Sudan": (6.8770, 31.3070), "Central African Republic": (6.6111, 20.9394),
-        "Democratic Republic of the Congo": (-4.0383, 21.7587), "DRC": (-4.0383, 21.7587),
-        "Congo, Democratic Republic of the": (-4.0383, 21.7587), "Mali": (17.5707, -3.9962),
-        "Angola": (-11.2027, 17.8739), "Burkina Faso": (12.2383, -1.5616),
-        "Cameroon": (7.3697, 12.3547), "Ivory Coast": (7.5400, -5.5471),
-        "Cote d'Ivoire": (7.5400, -5.5471), "British Virgin Islands": (18.4207, -64.6399),
-        "Monaco": (43.7384, 7.4246), "Mozambique": (-18.6657, 35.5296),
-        "Myanmar": (21.9162, 95.9560), "Laos": (19.8563, 102.4955),
-        "Nepal": (28.3949, 84.1240), "Somalia": (5.1521, 46.1996),
-        # Additional Cyrillic sanctioned regions
-        "Belarus": (53.7098, 27.9534), "Bulgaria": (42.7339, 25.4858),
-        "Crimea": (45.3388, 33.5000), "Donetsk": (48.0159, 37.8029),
-        "Luhansk": (48.5740, 39.3078),
-        # Oceania
-        "Australia": (-25.2744, 133.7751), "New Zealand": (-40.9006, 174.8860),
-        # Middle East (already listed above, keeping for organization)
-        "Kuwait": (29.3117, 47.4818), "Qatar": (25.3548, 51.1839),
-        "Bahrain": (25.9304, 50.6378), "Oman": (21.4735, 55.9754),
-    }
-    
     # Normalize country name for matching (lowercase, handle common variations)
     # Use normalized_country for coordinate lookup
     country_for_coords = normalized_country.strip().lower()
     
     # Try to find country in our map (case-insensitive, partial matching)
     lat, lon = None, None
-    for country_key, coords in country_coords.items():
-        country_key_lower = country_key.lower()
+    for country_key_lower, coords in _COUNTRY_COORDS_LOWER:
         # Exact match or substring match (either direction)
         if (country_key_lower == country_for_coords or
             country_key_lower in country_for_coords or
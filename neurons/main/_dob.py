@@ -1,45 +1,39 @@
 import random
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 
+# Fixed day offsets applied both forwards and backwards from the seed DOB
+_DOB_OFFSETS = (1, 3, 30, 90, 365)
+# Range the random filler offsets are drawn from
+_RANDOM_DAY_OFFSETS = range(-365, 366)
+
 def generate_dob_variations(dob: str, count: int = 15):
     """Generate DOB variations"""
     try:
-        base_date = datetime.strptime(dob, "%Y-%m-%d")
+        # Zero-padded YYYY-MM-DD is the usual case: fromisoformat parses it in C,
+        # everything else (e.g. unpadded months) still goes through strptime
+        if len(dob) == 10 and dob[4] == dob[7] == '-':
+            base_date = date.fromisoformat(dob)
+        else:
+            base_date = datetime.strptime(dob, "%Y-%m-%d").date()
     except:
-        base_date = datetime(1990, 1, 1)
-    
-    variations = []
-    
-    # ±1 day
-    variations.append((base_date + timedelta(days=1)).strftime("%Y-%m-%d"))
-    
-    # ±3 days
-    variations.append((base_date + timedelta(days=3)).strftime("%Y-%m-%d"))
-    
-    # ±30 days
-    variations.append((base_date + timedelta(days=30)).strftime("%Y-%m-%d"))
-    
-    # ±90 days
-    variations.append((base_date + timedelta(days=90)).strftime("%Y-%m-%d"))
+        base_date = date(1990, 1, 1)
     
-    # ±365 days
-    variations.append((base_date + timedelta(days=365)).strftime("%Y-%m-%d"))
+    # date.isoformat() gives the same YYYY-MM-DD text as strftime, without the format parsing
+    # ±1, ±3, ±30, ±90, ±365 days
+    variations = [(base_date + timedelta(days=days)).isoformat() for days in _DOB_OFFSETS]
     
     # Year+month only
-    variations.append(base_date.strftime("%Y-%m"))
+    variations.append(base_date.isoformat()[:7])
     
-    variations.append((base_date - timedelta(days=1)).strftime("%Y-%m-%d"))
-    variations.append((base_date - timedelta(days=3)).strftime("%Y-%m-%d"))
-    variations.append((base_date - timedelta(days=30)).strftime("%Y-%m-%d"))
-    variations.append((base_date - timedelta(days=90)).strftime("%Y-%m-%d"))
-    variations.append((base_date - timedelta(days=365)).strftime("%Y-%m-%d"))
+    variations.extend((base_date - timedelta(days=days)).isoformat() for days in _DOB_OFFSETS)
     
-    # Fill remaining with random variations
-    while len(variations) < count:
-        days_offset = random.randint(-365, 365)
-        new_date = base_date + timedelta(days=days_offset)
-        variations.append(new_date.strftime("%Y-%m-%d"))
+    # Fill remaining with random variations (all offsets drawn in one call)
+    if len(variations) < count:
+        variations.extend(
+            (base_date + timedelta(days=days_offset)).isoformat()
+            for days_offset in random.choices(_RANDOM_DAY_OFFSETS, k=count - len(variations))
+        )
     
-    return variations[:count]
\ No newline at end of file
+    return variations[:count]
@@ -14,6 +14,7 @@ import json
 import os
 import sys
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
@@ -28,6 +29,10 @@ except ImportError:
 # Import name_variations.py directly
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from _name_variations import generate_name_variations
+from _name import generate_name_variations_clean
+from _dob import generate_dob_variations
+from _address import generate_address_variations, generate_uav_address
+from _parse_query import parse_query_template
 
 # Import jellyfish for tiered similarity generation
 try:
@@ -46,64 +51,103 @@ class IdentitySynapse:
         self.query_template = query_template
         self.timeout = timeout
 
-def generate_variations(synapse: IdentitySynapse) :
+# Set MIID_VERBOSE=0 to skip the per-request template, identity and result listings
+# (neurons/miner.py imports this flag too, so the variable is parsed in one place)
+VERBOSE = os.getenv('MIID_VERBOSE', '1') != '0'
+
+# Label used when a UAV seed has no generated UAV address
+_UAV_FALLBACK_LABEL = "Seed address (UAV generation failed)"
+
+def _empty_uav(address: str, label: str) -> Dict:
+    """Build a UAV entry without coordinates (latitude/longitude are optional for the validator)."""
+    return {'address': address, 'label': label, 'latitude': None, 'longitude': None}
+
+def _pad_list_shape(var_list: List[List[str]], n: int) -> List[List[str]]:
+    """Pad [name, dob, address] rows to n entries with copies of the last row."""
+    last_var = var_list[-1]
+    var_list.extend([list(last_var) for _ in range(n - len(var_list))])
+    return var_list
+
+def _pad_str_shape(var_list: List[str], n: int) -> List[str]:
+    """Pad plain-string variations to n entries by repeating the last one."""
+    var_list.extend([var_list[-1]] * (n - len(var_list)))
+    return var_list
+
+def _resize(values: List[str], n: int, fallback: str) -> List[str]:
+    """Trim or pad values in place to exactly n entries, padding with fallback."""
+    del values[n:]
+    values.extend([fallback] * (n - len(values)))
+    return values
+
+# Recently generated seed entries, keyed on the identity plus everything in the query that
+# shapes its variations, so identities repeated across requests skip generation entirely.
+# Entries are stored frozen and rebuilt on every hit (callers mutate the lists).
+# Set MIID_SEED_CACHE=0 to disable.
+_SEED_CACHE_SIZE = int(os.getenv('MIID_SEED_CACHE', '256'))
+_seed_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+def _seed_cache_key(name: str, dob: str, address: str, requirements: Dict, is_uav_seed: bool) -> tuple:
+    """Hashable key for a seed: identity, variation/rule requirements and UAV flag."""
+    def freeze_distribution(dist):
+        return tuple(sorted(dist.items())) if dist else None
+    return (
+        name, dob, address, is_uav_seed,
+        requirements['variation_count'],
+        requirements['rule_percentage'],
+        tuple(requirements['rules']),
+        freeze_distribution(requirements.get('phonetic_similarity')),
+        freeze_distribution(requirements.get('orthographic_similarity')),
+    )
+
+def _seed_cache_get(key: tuple):
+    """Return a fresh copy of a cached entry, or None."""
+    if _SEED_CACHE_SIZE <= 0:
+        return None
+    frozen = _seed_cache.get(key)
+    if frozen is None:
+        return None
+    _seed_cache.move_to_end(key)
+    combined, uav_items = frozen
+    variations = [list(variation) for variation in combined]
+    if uav_items is None:
+        return variations
+    return {'variations': variations, 'uav': dict(uav_items)}
+
+def _seed_cache_put(key: tuple, entry) -> None:
+    """Store a successfully generated entry, evicting the least recently used one when full."""
+    if _SEED_CACHE_SIZE <= 0:
+        return
+    if isinstance(entry, dict):
+        frozen = (tuple(map(tuple, entry['variations'])), tuple(entry['uav'].items()))
+    else:
+        frozen = (tuple(map(tuple, entry)), None)
+    _seed_cache[key] = frozen
+    _seed_cache.move_to_end(key)
+    while len(_seed_cache) > _SEED_CACHE_SIZE:
+        _seed_cache.popitem(last=False)
+
+def _process_one_seed(identity, requirements: Dict, uav_seed_name: Optional[str]):
     """
-    Generate variations for all identities.
-    Returns different structure for UAV seed vs normal seeds.
+    Generate the variation entry for a single seed identity.
+    Returns (name, entry) where entry is the UAV dict for the UAV seed and a plain list otherwise.
+    A failing seed yields an empty list so the completeness checks below can pad it.
     """
-    print("=" * 80)
-    print("SYNAPSE LOADED SUCCESSFULLY")
-    print("=" * 80)
-    print(f"📊 Identities: {len(synapse.identity)}")
-    print(f"⏱️  Timeout: {synapse.timeout}s")
-    print(f"\n📋 Query Template:")
-    print(synapse.query_template)
-    print(f"\n👥 Identities:")
-    for i, identity in enumerate(synapse.identity, 1):
-        name = identity[0] if len(identity) > 0 else "Unknown"
-        dob = identity[1] if len(identity) > 1 else "Unknown"
-        address = identity[2] if len(identity) > 2 else "Unknown"
-        print(f"   {i:2d}. {name} | {dob} | {address}")
-    print("=" * 80)
-    
-    from _parse_query import parse_query_template
-    requirements = parse_query_template(synapse.query_template)
-    
-    print("=" * 80)
-    print("CLEAN VARIATION GENERATOR - NO VALIDATION, NO SCORING")
-    print("=" * 80)
-    print(f"\nRequirements:")
-    print(f"   Variation count: {requirements['variation_count']}")
-    print(f"   Rule percentage: {requirements['rule_percentage']*100:.0f}%")
-    print(f"   Rules: {requirements['rules']}")
-    if requirements.get('phonetic_similarity'):
-        print(f"   🎵 Phonetic Similarity: {requirements['phonetic_similarity']}")
-    if requirements.get('orthographic_similarity'):
-        print(f"   📝 Orthographic Similarity: {requirements['orthographic_similarity']}")
-    if requirements['uav_seed_name']:
-        print(f"   🎯 UAV Seed: {requirements['uav_seed_name']}")
-    print()
-    
-    all_variations = {}
-    uav_seed_name = requirements['uav_seed_name']
-    
-    # CRITICAL: Ensure we process ALL identities from seed (no missing names)
-    # Validator checks: missing_names = set(seed_names) - set(variations.keys())
-    seed_names = [identity[0] for identity in synapse.identity if len(identity) > 0]
-    
-    for identity in synapse.identity:
-        name = identity[0] if len(identity) > 0 else "Unknown"
-        dob = identity[1] if len(identity) > 1 else "1990-01-01"
-        address = identity[2] if len(identity) > 2 else "Unknown"
-        
+    name = identity[0] if len(identity) > 0 else "Unknown"
+    dob = identity[1] if len(identity) > 1 else "1990-01-01"
+    address = identity[2] if len(identity) > 2 else "Unknown"
+    is_uav_seed = bool(uav_seed_name and name.lower() == uav_seed_name.lower())
+    cache_key = _seed_cache_key(name, dob, address, requirements, is_uav_seed)
+    cached_entry = _seed_cache_get(cache_key)
+    if cached_entry is not None:
+        print(f"    Reusing cached variations for: {name}")
+        return name, cached_entry
+    try:
         print(f"    Processing: {name}")
-        is_uav_seed = (uav_seed_name and name.lower() == uav_seed_name.lower())
         
         if is_uav_seed:
             print(f"        This is the UAV seed - will include UAV data")
         
         # Generate variations with tiered similarity targeting
-        from _name import generate_name_variations_clean
         name_vars = generate_name_variations_clean(
             original_name=name,
             variation_count=requirements['variation_count'],
@@ -112,29 +156,20 @@ def generate_variations(synapse: IdentitySynapse) :
             phonetic_similarity=requirements.get('phonetic_similarity'),
             orthographic_similarity=requirements.get('orthographic_similarity')
         )
-        from _dob import generate_dob_variations
         dob_vars = generate_dob_variations(dob, requirements['variation_count'])
         
-        from _address import generate_address_variations
         address_vars = generate_address_variations(address, requirements['variation_count'])
         
         # CRITICAL: Ensure we have EXACTLY the requested count
         # Validator requires exact count match for completeness multiplier
         variation_count = requirements['variation_count']
         
-        # Ensure all arrays have at least the required count
-        while len(name_vars) < variation_count:
-            # Add more variations if needed
-            name_vars.append(name)
-        while len(dob_vars) < variation_count:
-            dob_vars.append(dob)
-        while len(address_vars) < variation_count:
-            address_vars.append(address)
-        
-        # Trim to exact count
-        name_vars = name_vars[:variation_count]
-        dob_vars = dob_vars[:variation_count]
-        address_vars = address_vars[:variation_count]
+        # Pad short arrays with the seed value and trim long ones; a padded entry means a
+        # generator came up short (possibly transiently), so it must not be cached either
+        padded = min(len(name_vars), len(dob_vars), len(address_vars)) < variation_count
+        _resize(name_vars, variation_count, name)
+        _resize(dob_vars, variation_count, dob)
+        _resize(address_vars, variation_count, address)
         
         # Combine into [name, dob, address] format
         # CRITICAL: Ensure no duplicates - validator penalizes duplicates
@@ -185,37 +220,117 @@ def generate_variations(synapse: IdentitySynapse) :
         # CRITICAL: Ensure exact count (validator checks this strictly)
         combined = combined[:variation_count]
         
+        # A UAV fallback is a (possibly transient) failure, so that entry must not be cached
+        uav_failed = False
+        
         # Phase 3: Return different structure for UAV seed
         if is_uav_seed:
             # Generate UAV address
-            from _address import generate_uav_address
-            uav_data = generate_uav_address(address)
+            try:
+                uav_data = generate_uav_address(address)
+            except Exception as e:
+                print(f"⚠️  WARNING: UAV generation failed for {name}: {e}")
+                uav_data = _empty_uav(address, _UAV_FALLBACK_LABEL)
+                uav_failed = True
             print(f"   🎯 Generated UAV: {uav_data['address']} ({uav_data['label']})")
             print(f"      Coordinates: ({uav_data['latitude']}, {uav_data['longitude']})")
             
             # UAV seed structure: {name: {variations: [...], uav: {...}}}
-            all_variations[name] = {
+            entry = {
                 'variations': combined,
                 'uav': uav_data
             }
         else:
             # Normal structure: {name: [[name, dob, addr], ...]}
-            all_variations[name] = combined
+            entry = combined
         
         print(f"   ✅ Generated {len(combined)} variations\n")
+        if not (uav_failed or padded):
+            _seed_cache_put(cache_key, entry)
+        return name, entry
+    except Exception as e:
+        print(f"⚠️  WARNING: Failed to generate variations for {name}: {e}")
+        if is_uav_seed:
+            # Keep the UAV structure so the validator still sees this seed in the new format
+            return name, {'variations': [], 'uav': _empty_uav(address, _UAV_FALLBACK_LABEL)}
+        return name, []
+
+def generate_variations(synapse: IdentitySynapse) :
+    """
+    Generate variations for all identities.
+    Returns different structure for UAV seed vs normal seeds.
+    """
+    if VERBOSE:
+        print("=" * 80)
+        print("SYNAPSE LOADED SUCCESSFULLY")
+        print("=" * 80)
+        print(f"📊 Identities: {len(synapse.identity)}")
+        print(f"⏱️  Timeout: {synapse.timeout}s")
+        print(f"\n📋 Query Template:")
+        print(synapse.query_template)
+        print(f"\n👥 Identities:")
+        for i, identity in enumerate(synapse.identity, 1):
+            name = identity[0] if len(identity) > 0 else "Unknown"
+            dob = identity[1] if len(identity) > 1 else "Unknown"
+            address = identity[2] if len(identity) > 2 else "Unknown"
+            print(f"   {i:2d}. {name} | {dob} | {address}")
+        print("=" * 80)
+    
+    requirements = parse_query_template(synapse.query_template)
+    
+    print("=" * 80)
+    print("CLEAN VARIATION GENERATOR - NO VALIDATION, NO SCORING")
+    print("=" * 80)
+    print(f"\nRequirements:")
+    print(f"   Variation count: {requirements['variation_count']}")
+    print(f"   Rule percentage: {requirements['rule_percentage']*100:.0f}%")
+    print(f"   Rules: {requirements['rules']}")
+    if requirements.get('phonetic_similarity'):
+        print(f"   🎵 Phonetic Similarity: {requirements['phonetic_similarity']}")
+    if requirements.get('orthographic_similarity'):
+        print(f"   📝 Orthographic Similarity: {requirements['orthographic_similarity']}")
+    if requirements['uav_seed_name']:
+        print(f"   🎯 UAV Seed: {requirements['uav_seed_name']}")
+    print()
+    
+    all_variations = {}
+    uav_seed_name = requirements['uav_seed_name']
+    
+    # CRITICAL: Ensure we process ALL identities from seed (no missing names)
+    # Validator checks: missing_names = set(seed_names) - set(variations.keys())
+    # Empty identities have no seed name; filter them out once for every lookup below
+    identities = [identity for identity in synapse.identity if identity]
+    seed_names = [identity[0] for identity in identities]
+    
+    seed_name_set = set(seed_names)
+    
+    # Repeated identities would only overwrite the same key, so generate each one once
+    unique_identities = list(dict.fromkeys(tuple(identity) for identity in identities))
+    if len(unique_identities) < len(synapse.identity):
+        print(f"   Skipping {len(synapse.identity) - len(unique_identities)} duplicate or empty identities")
+    
+    # Seeds are processed one at a time: generation is pure CPU work, and the similarity
+    # scorer re-seeds the global RNG, so concurrent seeds would interleave its draws
+    for identity in unique_identities:
+        name, entry = _process_one_seed(identity, requirements, uav_seed_name)
+        all_variations[name] = entry
     
     # CRITICAL: Validate completeness before returning
     # 1. Check for missing names
     output_names = set(all_variations.keys())
-    missing = set(seed_names) - output_names
+    missing = seed_name_set - output_names
     if missing:
         print(f"⚠️  WARNING: Missing names in output: {missing}")
         # Add missing names with empty variations (shouldn't happen, but safety check)
         for missing_name in missing:
-            all_variations[missing_name] = []
+            if uav_seed_name and missing_name.lower() == uav_seed_name.lower():
+                missing_address = next((identity[2] for identity in unique_identities if identity[0] == missing_name and len(identity) > 2), "Unknown")
+                all_variations[missing_name] = {'variations': [], 'uav': _empty_uav(missing_address, _UAV_FALLBACK_LABEL)}
+            else:
+                all_variations[missing_name] = []
     
     # 2. Check for extra names (names not in seed)
-    extra = output_names - set(seed_names)
+    extra = output_names - seed_name_set
     if extra:
         print(f"⚠️  WARNING: Extra names in output (will be penalized): {extra}")
         # Remove extra names to avoid penalty
@@ -238,12 +353,14 @@ def generate_variations(synapse: IdentitySynapse) :
             if actual_count < expected_count:
                 # Pad with last variation or default
                 if var_list:
-                    last_var = var_list[-1]
-                    while len(var_list) < expected_count:
-                        var_list.append(last_var.copy() if isinstance(last_var, list) else last_var)
+                    # Shape is decided once per seed, not per padded row
+                    if isinstance(var_list[-1], list):
+                        _pad_list_shape(var_list, expected_count)
+                    else:
+                        _pad_str_shape(var_list, expected_count)
                 else:
                     # No variations - add default
-                    default_identity = next((id for id in synapse.identity if id[0] == name), None)
+                    default_identity = next((identity for identity in identities if identity[0] == name), None)
                     if default_identity:
                         default_var = [
                             default_identity[0] if len(default_identity) > 0 else name,
@@ -255,7 +372,7 @@ def generate_variations(synapse: IdentitySynapse) :
                         var_list = [[name, "1990-01-01", "Unknown"] for _ in range(expected_count)]
             else:
                 # Trim to exact count
-                var_list = var_list[:expected_count]
+                del var_list[expected_count:]
             
             # Update the variations
             if isinstance(variations, dict):
@@ -264,14 +381,15 @@ def generate_variations(synapse: IdentitySynapse) :
             else:
                 all_variations[name] = var_list
     
-    print("\n" + "=" * 80)
-    print("RESULTS")
-    print("=" * 80)
-    
-    for original_name, var_list in all_variations.items():
-        print(f"\n📝 Variations for: {original_name}")
-        for i, var in enumerate(var_list, 1):
-            print(f"   {i}. {var[0]} | {var[1]} | {var[2]}")
+    if VERBOSE:
+        print("\n" + "=" * 80)
+        print("RESULTS")
+        print("=" * 80)
+        
+        for original_name, var_list in all_variations.items():
+            print(f"\n📝 Variations for: {original_name}")
+            for i, var in enumerate(var_list, 1):
+                print(f"   {i}. {var[0]} | {var[1]} | {var[2]}")
     
     return all_variations
 
@@ -1,5 +1,6 @@
 import random
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional
 
 
@@ -21,6 +22,33 @@ except ImportError:
 
 from _name_variations import generate_name_variations
 
+SIMILARITY_TIERS = ('Light', 'Medium', 'Far')
+
+@lru_cache(maxsize=64)
+def calculate_rule_count(variation_count: int, rule_percentage: float) -> int:
+    """Number of rule-based variations: rounded to nearest and never more than variation_count"""
+    return min(round(variation_count * rule_percentage), variation_count)
+
+@lru_cache(maxsize=64)
+def _similarity_counts_cached(variation_count: int, dist_key: frozenset) -> tuple:
+    similarity_dist = dict(dist_key)
+    raw = [variation_count * similarity_dist.get(tier, 0.0) for tier in SIMILARITY_TIERS]
+    counts = [int(x) for x in raw]
+    # Largest remainder: hand the units lost to truncation to the tiers with the biggest fractions
+    remainder = round(sum(raw)) - sum(counts)
+    by_fraction = sorted(range(len(raw)), key=lambda i: raw[i] - counts[i], reverse=True)
+    for i in by_fraction[:max(remainder, 0)]:
+        counts[i] += 1
+    return tuple(counts)
+
+def get_similarity_counts(variation_count: int, similarity_dist: Dict[str, float]) -> Dict[str, int]:
+    """
+    Split variation_count across Light/Medium/Far according to similarity_dist (largest-remainder apportionment).
+    Only a handful of (count, distribution) pairs occur per round, so results are memoized.
+    """
+    counts = _similarity_counts_cached(variation_count, frozenset(similarity_dist.items()))
+    return dict(zip(SIMILARITY_TIERS, counts))
+
 def generate_name_variations_clean(original_name: str, variation_count: int, 
                                    rule_percentage: float, rules,
                                    phonetic_similarity,
@@ -38,9 +66,7 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
     """
     # CRITICAL: Ensure exact rule percentage matching (validator checks this strictly)
     # Round to nearest integer for better accuracy
-    rule_based_count = round(variation_count * rule_percentage)
-    # Ensure we don't exceed total count
-    rule_based_count = min(rule_based_count, variation_count)
+    rule_based_count = calculate_rule_count(variation_count, rule_percentage)
     non_rule_count = variation_count - rule_based_count
     
     # Ensure non_rule_count is non-negative
@@ -268,6 +294,14 @@ def generate_name_variations_clean(original_name: str, variation_count: int,
     return variations[:variation_count]
 
 
+# Phonetic algorithms the validator samples from (order matters for the seeded sample)
+_PHONETIC_ALGORITHMS = {
+    "soundex": lambda x, y: jellyfish.soundex(x) == jellyfish.soundex(y),
+    "metaphone": lambda x, y: jellyfish.metaphone(x) == jellyfish.metaphone(y),
+    "nysiis": lambda x, y: jellyfish.nysiis(x) == jellyfish.nysiis(y),
+}
+_PHONETIC_ALGORITHM_NAMES = tuple(_PHONETIC_ALGORITHMS)
+
 def calculate_phonetic_similarity_score(original: str, variation: str) -> float:
     """
     Calculate phonetic similarity score using same logic as validator.
@@ -279,15 +313,9 @@ def calculate_phonetic_similarity_score(original: str, variation: str) -> float:
     
     try:
         # Use same logic as validator - randomized subset of algorithms
-        algorithms = {
-            "soundex": lambda x, y: jellyfish.soundex(x) == jellyfish.soundex(y),
-            "metaphone": lambda x, y: jellyfish.metaphone(x) == jellyfish.metaphone(y),
-            "nysiis": lambda x, y: jellyfish.nysiis(x) == jellyfish.nysiis(y),
-        }
-        
         # Deterministically seed based on original name (same as validator)
         random.seed(hash(original) % 10000)
-        selected_algorithms = random.sample(list(algorithms.keys()), k=min(3, len(algorithms)))
+        selected_algorithms = random.sample(_PHONETIC_ALGORITHM_NAMES, k=min(3, len(_PHONETIC_ALGORITHMS)))
         
         # Generate random weights that sum to 1.0 (same as validator)
         weights = [random.random() for _ in selected_algorithms]
@@ -296,7 +324,7 @@ def calculate_phonetic_similarity_score(original: str, variation: str) -> float:
         
         # Calculate weighted phonetic score
         phonetic_score = sum(
-            (1.0 if algorithms[algo](original, variation) else 0.0) * weight
+            (1.0 if _PHONETIC_ALGORITHMS[algo](original, variation) else 0.0) * weight
             for algo, weight in zip(selected_algorithms, normalized_weights)
         )
         
@@ -349,10 +377,12 @@ def get_levenshtein_tier(original: str, candidate: str) -> str:
     return get_orthographic_tier_from_score(score)
 
 
+@lru_cache(maxsize=4096)
 def calculate_orthographic_similarity_score(original: str, variation: str) -> float:
     """
     Calculate orthographic similarity score using same logic as validator.
     Uses Levenshtein distance normalized to 0-1.
+    Pure, and the same pairs are scored repeatedly while tiering and filtering, so results are cached.
     Returns: similarity score between 0.0 and 1.0
     """
     if not JELLYFISH_AVAILABLE:
@@ -403,13 +433,8 @@ def generate_tiered_name_variations(
         orthographic_similarity = {'Medium': 1.0}
     
     # Calculate required counts for each tier
-    phonetic_counts = {}
-    for tier in ['Light', 'Medium', 'Far']:
-        phonetic_counts[tier] = int(non_rule_count * phonetic_similarity.get(tier, 0.0))
-    
-    orthographic_counts = {}
-    for tier in ['Light', 'Medium', 'Far']:
-        orthographic_counts[tier] = int(non_rule_count * orthographic_similarity.get(tier, 0.0))
+    phonetic_counts = get_similarity_counts(non_rule_count, phonetic_similarity)
+    orthographic_counts = get_similarity_counts(non_rule_count, orthographic_similarity)
     
     # Categorize candidates by both phonetic and orthographic similarity
     candidates_by_tiers = {
@@ -772,12 +797,24 @@ def generate_non_latin_variations(name: str, script: str, count: int):
 
 # =========================rlue===================================/
 
+# Rule lookup tables, built once instead of on every rule application
+_SPACE_REPLACEMENTS = ('_', '-', '@', '.')
+_TITLE_PREFIXES = ('Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'Rev.', 'Sir', 'Lady')
+_TITLE_SUFFIXES = ('Jr.', 'Sr.', 'PhD', 'MD', 'III', 'II', 'Esq.')
+_VOWEL_REPLACEMENTS = {'a': ['e', 'i', 'o', 'u'], 'e': ['a', 'i', 'o', 'u'], 'i': ['a', 'e', 'o', 'u'],
+                       'o': ['a', 'e', 'i', 'u'], 'u': ['a', 'e', 'i', 'o'],
+                       'A': ['E', 'I', 'O', 'U'], 'E': ['A', 'I', 'O', 'U'], 'I': ['A', 'E', 'O', 'U'],
+                       'O': ['A', 'E', 'I', 'U'], 'U': ['A', 'E', 'I', 'O']}
+_CONSONANTS = 'bcdfghjklmnpqrstvwxz'
+# Each consonant maps to every other consonant, in both cases
+_CONSONANT_REPLACEMENTS = {c: [o for o in _CONSONANTS if o != c] for c in _CONSONANTS}
+_CONSONANT_REPLACEMENTS.update({c.upper(): [o.upper() for o in others] for c, others in list(_CONSONANT_REPLACEMENTS.items())})
+
 def apply_replace_spaces_with_special_chars(name: str) -> str:
     """Replace spaces with special characters"""
     if ' ' not in name:
         return name
-    special_chars = ['_', '-', '@', '.']
-    return name.replace(' ', random.choice(special_chars))
+    return name.replace(' ', random.choice(_SPACE_REPLACEMENTS))
 
 def apply_delete_random_letter(name: str) -> str:
     """Delete a random letter"""
@@ -821,8 +858,7 @@ def apply_swap_adjacent_syllables(name: str) -> str:
 
 def apply_add_title_suffix(name: str) -> str:
     """Add a title suffix (Jr., PhD, etc.)"""
-    suffixes = ['Jr.', 'Sr.', 'PhD', 'MD', 'III', 'II', 'Esq.']
-    return name + " " + random.choice(suffixes)
+    return name + " " + random.choice(_TITLE_SUFFIXES)
 
 def apply_abbreviate_name_parts(name: str) -> str:
     """Abbreviate name parts (e.g., "John" -> "J.")"""
@@ -837,11 +873,6 @@ def apply_abbreviate_name_parts(name: str) -> str:
 
 def apply_replace_random_vowels(name: str) -> str:
     """Replace random vowels with different vowels"""
-    vowels = {'a': ['e', 'i', 'o', 'u'], 'e': ['a', 'i', 'o', 'u'], 'i': ['a', 'e', 'o', 'u'],
-              'o': ['a', 'e', 'i', 'u'], 'u': ['a', 'e', 'i', 'o'],
-              'A': ['E', 'I', 'O', 'U'], 'E': ['A', 'I', 'O', 'U'], 'I': ['A', 'E', 'O', 'U'],
-              'O': ['A', 'E', 'I', 'U'], 'U': ['A', 'E', 'I', 'O']}
-    
     result = list(name)
     vowel_indices = [i for i, char in enumerate(name) if char.lower() in 'aeiou']
     
@@ -852,8 +883,8 @@ def apply_replace_random_vowels(name: str) -> str:
         
         for idx in indices_to_replace:
             char = name[idx]
-            if char in vowels:
-                result[idx] = random.choice(vowels[char])
+            if char in _VOWEL_REPLACEMENTS:
+                result[idx] = random.choice(_VOWEL_REPLACEMENTS[char])
     
     return ''.join(result)
 
@@ -886,32 +917,6 @@ def apply_reorder_name_parts(name: str) -> str:
 
 def apply_replace_random_consonants(name: str) -> str:
     """Replace random consonants with different consonants"""
-    consonants = {
-        'b': ['c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'c': ['b', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'd': ['b', 'c', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'f': ['b', 'c', 'd', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'g': ['b', 'c', 'd', 'f', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'h': ['b', 'c', 'd', 'f', 'g', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'j': ['b', 'c', 'd', 'f', 'g', 'h', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'k': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'l': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'm': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'n': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'p': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'q', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'q': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v', 'w', 'x', 'z'],
-        'r': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 's', 't', 'v', 'w', 'x', 'z'],
-        's': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 't', 'v', 'w', 'x', 'z'],
-        't': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 'v', 'w', 'x', 'z'],
-        'v': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'w', 'x', 'z'],
-        'w': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'x', 'z'],
-        'x': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'z'],
-        'z': ['b', 'c', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'q', 'r', 's', 't', 'v', 'w', 'x']
-    }
-    # Add uppercase versions
-    for key in list(consonants.keys()):
-        consonants[key.upper()] = [c.upper() for c in consonants[key]]
-    
     result = list(name)
     consonant_indices = [i for i, char in enumerate(name) if char.isalpha() and char.lower() not in 'aeiou']
     
@@ -922,8 +927,8 @@ def apply_replace_random_consonants(name: str) -> str:
         
         for idx in indices_to_replace:
             char = name[idx]
-            if char.lower() in consonants:
-                result[idx] = random.choice(consonants[char.lower() if char.islower() else char.upper()])
+            if char.lower() in _CONSONANT_REPLACEMENTS:
+                result[idx] = random.choice(_CONSONANT_REPLACEMENTS[char.lower() if char.islower() else char.upper()])
     
     return ''.join(result)
 
@@ -995,8 +1000,7 @@ def apply_insert_random_letter(name: str) -> str:
 
 def apply_add_title_prefix(name: str) -> str:
     """Add a title prefix (Mr., Dr., etc.)"""
-    prefixes = ['Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'Rev.', 'Sir', 'Lady']
-    return random.choice(prefixes) + " " + name
+    return random.choice(_TITLE_PREFIXES) + " " + name
 
 def apply_initial_only_first_name(name: str) -> str:
     """Use first name initial with last name (e.g., 'John Doe' -> 'J. Doe')"""
@@ -1018,52 +1022,54 @@ def apply_shorten_to_initials(name: str) -> str:
         return parts[0][0] + "."
     return name
 
+# Rule id (including validator aliases) -> applier
+RULE_APPLIERS = {
+    # Character replacement
+    'replace_spaces_with_special_characters': apply_replace_spaces_with_special_chars,
+    'replace_double_letters': apply_replace_double_letters,
+    'replace_random_vowels': apply_replace_random_vowels,
+    'replace_random_consonants': apply_replace_random_consonants,
+    
+    # Character swapping
+    'swap_adjacent_consonants': apply_swap_adjacent_consonants,
+    'swap_adjacent_syllables': apply_swap_adjacent_syllables,
+    'swap_random_letter': apply_swap_random_letter,
+    
+    # Character removal
+    'delete_random_letter': apply_delete_random_letter,
+    'remove_random_vowel': apply_remove_random_vowel,
+    'remove_random_consonant': apply_remove_random_consonant,
+    'remove_all_spaces': apply_remove_all_spaces,
+    
+    # Character insertion
+    'duplicate_random_letter': apply_duplicate_random_letter,
+    'insert_random_letter': apply_insert_random_letter,
+    'add_title_prefix': apply_add_title_prefix,
+    'add_title_suffix': apply_add_title_suffix,
+    
+    # Name formatting
+    'initial_only_first_name': apply_initial_only_first_name,
+    'shorten_to_initials': apply_shorten_to_initials,
+    'abbreviate_name_parts': apply_abbreviate_name_parts,
+    
+    # Structure change
+    'reorder_name_parts': apply_reorder_name_parts,
+    
+    # Aliases for validator rule names
+    'replace_spaces_with_random_special_characters': apply_replace_spaces_with_special_chars,
+    'replace_double_letters_with_single_letter': apply_replace_double_letters,
+    'replace_random_vowel_with_random_vowel': apply_replace_random_vowels,
+    'replace_random_consonant_with_random_consonant': apply_replace_random_consonants,
+    'duplicate_random_letter_as_double_letter': apply_duplicate_random_letter,
+    'add_random_leading_title': apply_add_title_prefix,
+    'add_random_trailing_title': apply_add_title_suffix,
+    'shorten_name_to_initials': apply_shorten_to_initials,
+    'shorten_name_to_abbreviations': apply_abbreviate_name_parts,
+    'name_parts_permutations': apply_reorder_name_parts,
+}
+
 def apply_rule_to_name(name: str, rule: str) -> str:
     """Apply a rule to a name"""
-    rule_map = {
-        # Character replacement
-        'replace_spaces_with_special_characters': apply_replace_spaces_with_special_chars,
-        'replace_double_letters': apply_replace_double_letters,
-        'replace_random_vowels': apply_replace_random_vowels,
-        'replace_random_consonants': apply_replace_random_consonants,
-        
-        # Character swapping
-        'swap_adjacent_consonants': apply_swap_adjacent_consonants,
-        'swap_adjacent_syllables': apply_swap_adjacent_syllables,
-        'swap_random_letter': apply_swap_random_letter,
-        
-        # Character removal
-        'delete_random_letter': apply_delete_random_letter,
-        'remove_random_vowel': apply_remove_random_vowel,
-        'remove_random_consonant': apply_remove_random_consonant,
-        'remove_all_spaces': apply_remove_all_spaces,
-        
-        # Character insertion
-        'duplicate_random_letter': apply_duplicate_random_letter,
-        'insert_random_letter': apply_insert_random_letter,
-        'add_title_prefix': apply_add_title_prefix,
-        'add_title_suffix': apply_add_title_suffix,
-        
-        # Name formatting
-        'initial_only_first_name': apply_initial_only_first_name,
-        'shorten_to_initials': apply_shorten_to_initials,
-        'abbreviate_name_parts': apply_abbreviate_name_parts,
-        
-        # Structure change
-        'reorder_name_parts': apply_reorder_name_parts,
-        
-        # Aliases for validator rule names
-        'replace_spaces_with_random_special_characters': apply_replace_spaces_with_special_chars,
-        'replace_double_letters_with_single_letter': apply_replace_double_letters,
-        'replace_random_vowel_with_random_vowel': apply_replace_random_vowels,
-        'replace_random_consonant_with_random_consonant': apply_replace_random_consonants,
-        'duplicate_random_letter_as_double_letter': apply_duplicate_random_letter,
-        'add_random_leading_title': apply_add_title_prefix,
-        'add_random_trailing_title': apply_add_title_suffix,
-        'shorten_name_to_initials': apply_shorten_to_initials,
-        'shorten_name_to_abbreviations': apply_abbreviate_name_parts,
-        'name_parts_permutations': apply_reorder_name_parts,
-    }
-    func = rule_map.get(rule)
+    func = RULE_APPLIERS.get(rule)
     return func(name) if func else name
 # ======================================================
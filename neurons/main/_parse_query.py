@@ -1,169 +1,308 @@
 import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Tuple
 
-def parse_query_template(query_template: str):
-    """Extract requirements from query template"""
-    requirements = {
-        'variation_count': 15,
-        'rule_percentage': 0,
-        'rules': [],
-        'phonetic_similarity': {},
-        'orthographic_similarity': {},
-        'uav_seed_name': None  # Phase 3: UAV seed name
-    }
-    
-    # Extract variation count
-    count_match = re.search(r'Generate\s+(\d+)\s+variations', query_template, re.I)
-    if count_match:
-        requirements['variation_count'] = int(count_match.group(1))
-    
-    # Extract rule percentage - look for patterns like "X% of", "approximately X%", "include X%"
-    rule_pct_patterns = [
-        r'approximately\s+(\d+)%\s+of',  # "Approximately 24% of"
-        r'also\s+include\s+(\d+)%\s+of', # "also include 44% of"
-        r'(\d+)%\s+of\s+the\s+total',     # "24% of the total"
-        r'(\d+)%\s+of\s+variations',      # "24% of variations"
-        r'include\s+(\d+)%',              # "include 24%"
-        r'(\d+)%\s+should\s+follow'       # "24% should follow"
-    ]
-    for pattern in rule_pct_patterns:
-        rule_pct_match = re.search(pattern, query_template, re.I)
-        if rule_pct_match:
-            pct = rule_pct_match.group(1)
-            requirements['rule_percentage'] = int(pct) / 100
-            break
-    
-    # Extract rules - check various phrasings
+# Hyperscan matches every rule phrase in a single pass when it is installed
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# pyahocorasick gives the same single-pass scan where hyperscan is not available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Rule phrasings found in validator templates, mapped to rule ids (grouped in rule order)
+rule_mappings = {
     # Character replacement
-    if 'replace spaces with special characters' in query_template.lower() or 'replace spaces with random special characters' in query_template.lower():
-        requirements['rules'].append('replace_spaces_with_special_characters')
-    if 'replace double letters' in query_template.lower() or 'replace double letters with single letter' in query_template.lower():
-        requirements['rules'].append('replace_double_letters')
-    if 'replace random vowels' in query_template.lower() or 'replace vowels with different vowels' in query_template.lower():
-        requirements['rules'].append('replace_random_vowels')
-    if 'replace random consonants' in query_template.lower() or 'replace consonants with different consonants' in query_template.lower():
-        requirements['rules'].append('replace_random_consonants')
-    
+    'replace spaces with special characters': 'replace_spaces_with_special_characters',
+    'replace spaces with random special characters': 'replace_spaces_with_special_characters',
+    'replace double letters': 'replace_double_letters',
+    'replace double letters with single letter': 'replace_double_letters',
+    'replace random vowels': 'replace_random_vowels',
+    'replace vowels with different vowels': 'replace_random_vowels',
+    'replace random consonants': 'replace_random_consonants',
+    'replace consonants with different consonants': 'replace_random_consonants',
     # Character swapping
-    if 'swap adjacent consonants' in query_template.lower():
-        requirements['rules'].append('swap_adjacent_consonants')
-    if 'swap adjacent syllables' in query_template.lower():
-        requirements['rules'].append('swap_adjacent_syllables')
-    if 'swap random letter' in query_template.lower() or 'swap random adjacent letters' in query_template.lower():
-        requirements['rules'].append('swap_random_letter')
-    
+    'swap adjacent consonants': 'swap_adjacent_consonants',
+    'swap adjacent syllables': 'swap_adjacent_syllables',
+    'swap random letter': 'swap_random_letter',
+    'swap random adjacent letters': 'swap_random_letter',
     # Character removal
-    if 'delete a random letter' in query_template.lower() or 'delete random letter' in query_template.lower():
-        requirements['rules'].append('delete_random_letter')
-    if 'remove random vowel' in query_template.lower() or 'remove a random vowel' in query_template.lower():
-        requirements['rules'].append('remove_random_vowel')
-    if 'remove random consonant' in query_template.lower() or 'remove a random consonant' in query_template.lower():
-        requirements['rules'].append('remove_random_consonant')
-    if 'remove all spaces' in query_template.lower() or 'remove spaces' in query_template.lower():
-        requirements['rules'].append('remove_all_spaces')
-    
+    'delete a random letter': 'delete_random_letter',
+    'delete random letter': 'delete_random_letter',
+    'remove random vowel': 'remove_random_vowel',
+    'remove a random vowel': 'remove_random_vowel',
+    'remove random consonant': 'remove_random_consonant',
+    'remove a random consonant': 'remove_random_consonant',
+    'remove all spaces': 'remove_all_spaces',
+    'remove spaces': 'remove_all_spaces',
     # Character insertion
-    if 'duplicate a random letter' in query_template.lower() or 'duplicate random letter' in query_template.lower():
-        requirements['rules'].append('duplicate_random_letter')
-    if 'insert random letter' in query_template.lower() or 'insert a random letter' in query_template.lower():
-        requirements['rules'].append('insert_random_letter')
-    if 'add a title prefix' in query_template.lower() or 'title prefix' in query_template.lower() or 'add title prefix' in query_template.lower():
-        requirements['rules'].append('add_title_prefix')
-    if 'add a title suffix' in query_template.lower() or 'title suffix' in query_template.lower() or 'add title suffix' in query_template.lower():
-        requirements['rules'].append('add_title_suffix')
-    
+    'duplicate a random letter': 'duplicate_random_letter',
+    'duplicate random letter': 'duplicate_random_letter',
+    'insert random letter': 'insert_random_letter',
+    'insert a random letter': 'insert_random_letter',
+    'add a title prefix': 'add_title_prefix',
+    'title prefix': 'add_title_prefix',
+    'add title prefix': 'add_title_prefix',
+    'add a title suffix': 'add_title_suffix',
+    'title suffix': 'add_title_suffix',
+    'add title suffix': 'add_title_suffix',
     # Name formatting
-    if 'use first name initial' in query_template.lower() or 'first name initial with last name' in query_template.lower():
-        requirements['rules'].append('initial_only_first_name')
-    if 'convert name to initials' in query_template.lower() or 'shorten name to initials' in query_template.lower():
-        requirements['rules'].append('shorten_to_initials')
-    if 'abbreviate name parts' in query_template.lower() or 'abbreviate' in query_template.lower() or 'shorten name to abbreviations' in query_template.lower():
-        requirements['rules'].append('abbreviate_name_parts')
-    
+    'use first name initial': 'initial_only_first_name',
+    'first name initial with last name': 'initial_only_first_name',
+    'convert name to initials': 'shorten_to_initials',
+    'shorten name to initials': 'shorten_to_initials',
+    'abbreviate name parts': 'abbreviate_name_parts',
+    'abbreviate': 'abbreviate_name_parts',
+    'shorten name to abbreviations': 'abbreviate_name_parts',
     # Structure change
-    if 'reorder name parts' in query_template.lower() or 'reorder parts' in query_template.lower() or 'name parts permutations' in query_template.lower():
-        requirements['rules'].append('reorder_name_parts')
+    'reorder name parts': 'reorder_name_parts',
+    'reorder parts': 'reorder_name_parts',
+    'name parts permutations': 'reorder_name_parts',
+}
+
+# Interned rule ids so downstream comparisons against them are identity checks
+_RULE_IDS = {phrase: sys.intern(rule_id) for phrase, rule_id in rule_mappings.items()}
+
+# Distinct rule ids in rule order, used to order multi-pattern scan results
+_RULE_ORDER = tuple(dict.fromkeys(_RULE_IDS.values()))
+
+# Keywords covering the rule phrases, so a template without any of them has no rules.
+# A phrase added to rule_mappings that none of them covers is appended whole, which keeps
+# the prefilter exact however the mappings grow.
+_RULE_KEYWORDS = ('replace', 'swap', 'delete', 'remove', 'duplicate', 'insert',
+                  'title', 'initial', 'abbreviat', 'reorder', 'permutation')
+_RULE_PREFIX_HINTS = _RULE_KEYWORDS + tuple(
+    phrase for phrase in _RULE_IDS if not any(keyword in phrase for keyword in _RULE_KEYWORDS)
+)
+
+_HS_DB = None
+_HS_RULE_IDS = tuple(_RULE_IDS.values())
+_HS_LOCK = threading.Lock()  # a hyperscan database shares one scratch space between scans
+if HYPERSCAN_AVAILABLE:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[re.escape(phrase).encode() for phrase in _RULE_IDS],
+            ids=list(range(len(_RULE_IDS))),
+            elements=len(_RULE_IDS),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_RULE_IDS),
+        )
+    except Exception as e:
+        print(f"⚠️  Warning: hyperscan rule database failed to compile, using substring scan: {e}")
+        _HS_DB = None
+
+_RULES_AC = None
+if _HS_DB is None and AHOCORASICK_AVAILABLE:
+    _RULES_AC = ahocorasick.Automaton()
+    for phrase, rule_id in _RULE_IDS.items():
+        _RULES_AC.add_word(phrase, rule_id)
+    _RULES_AC.make_automaton()
+
+def _on_hs_match(pattern_id, start, end, flags, context):
+    context.add(_HS_RULE_IDS[pattern_id])
+
+@lru_cache(maxsize=128)
+def _extract_rules(query_lower: str) -> Tuple[str, ...]:
+    """Return the rule ids mentioned in the lower-cased template as a tuple, deduplicated in rule order"""
+    if _HS_DB is not None:
+        hits = set()
+        with _HS_LOCK:
+            _HS_DB.scan(query_lower.encode(), match_event_handler=_on_hs_match, context=hits)
+        return tuple(rule_id for rule_id in _RULE_ORDER if rule_id in hits)
+    
+    if _RULES_AC is not None:
+        hits = {rule_id for _, rule_id in _RULES_AC.iter(query_lower)}
+        return tuple(rule_id for rule_id in _RULE_ORDER if rule_id in hits)
+    
+    if not any(hint in query_lower for hint in _RULE_PREFIX_HINTS):
+        return ()
+    
+    seen = {}
+    for phrase, rule_id in _RULE_IDS.items():
+        if phrase in query_lower:
+            seen[rule_id] = None
+    return tuple(seen)
+
+# Extractor patterns, compiled once; all but the UAV one run on the lower-cased template
+_COUNT_RE = re.compile(r'generate\s+(\d+)\s+variations')
+_RULE_PCT_PATTERNS = (
+    re.compile(r'approximately\s+(\d+)%\s+of'),  # "Approximately 24% of"
+    re.compile(r'also\s+include\s+(\d+)%\s+of'), # "also include 44% of"
+    re.compile(r'(\d+)%\s+of\s+the\s+total'),     # "24% of the total"
+    re.compile(r'(\d+)%\s+of\s+variations'),      # "24% of variations"
+    re.compile(r'include\s+(\d+)%'),              # "include 24%"
+    re.compile(r'(\d+)%\s+should\s+follow'),      # "24% should follow"
+)
+_PHONETIC_HINTS_RE = re.compile(r'\[validation hints\].*?phonetic similarity:\s*([^.;]+)', re.DOTALL)
+_PHONETIC_HINTS_PCT_RE = re.compile(r'(\d+)%\s+light.*?(\d+)%\s+medium.*?(\d+)%\s+far')
+_PHONETIC_DIST_RE = re.compile(r'phonetic similarity.*?distribution.*?(\d+)%\s+light.*?(\d+)%\s+medium.*?(\d+)%\s+far', re.DOTALL)
+_PHONETIC_ALT_RE = re.compile(r'phonetic similarity.*?(\d+)%\s+light.*?(\d+)%\s+medium.*?(\d+)%\s+far', re.DOTALL)
+_ORTHOGRAPHIC_HINTS_RE = re.compile(r'\[validation hints\].*?orthographic similarity:\s*([^.;]+)', re.DOTALL)
+_ORTHOGRAPHIC_HINTS_PCT_RE = re.compile(r'(\d+)%\s+light.*?(\d+)%\s+medium(?:.*?(\d+)%\s+far)?')
+_ORTHOGRAPHIC_DIST_RE = re.compile(r'orthographic similarity.*?distribution.*?(\d+)%\s+light.*?(\d+)%\s+medium', re.DOTALL)
+_ORTHOGRAPHIC_ALT_RE = re.compile(r'orthographic similarity.*?(\d+)%\s+light.*?(\d+)%\s+medium(?:.*?(\d+)%\s+far)?', re.DOTALL)
+_UAV_SEED_RE = re.compile(r'For the seed "([^"]+)" ONLY', re.I)
+
+def _extract_variation_count(query_lower: str):
+    """Extract the requested variation count, or None if the template does not state one"""
+    count_match = _COUNT_RE.search(query_lower)
+    if count_match:
+        return int(count_match.group(1))
+    return None
+
+def _extract_rule_percentage(query_lower: str):
+    """Extract the rule-based percentage as a fraction - patterns like "X% of", "approximately X%", "include X%" """
+    for pattern in _RULE_PCT_PATTERNS:
+        rule_pct_match = pattern.search(query_lower)
+        if rule_pct_match:
+            pct = rule_pct_match.group(1)
+            return int(pct) / 100
+    return 0
+
+def _extract_phonetic_similarity(query_lower: str, hints_at: int):
+    """Extract the phonetic similarity distribution (Light/Medium/Far percentages)"""
+    # Every phonetic pattern starts from this phrase, so searches can begin at it
+    phonetic_at = query_lower.find('phonetic similarity')
+    if phonetic_at < 0:
+        return {}
     
-    # Extract phonetic similarity distribution (Light/Medium/Far percentages)
     # First try VALIDATION HINTS section (more reliable format)
-    phonetic_match = re.search(r'\[VALIDATION HINTS\].*?Phonetic similarity:\s*([^.;]+)', query_template, re.I | re.DOTALL)
+    phonetic_match = _PHONETIC_HINTS_RE.search(query_lower, hints_at) if hints_at >= 0 else None
     if phonetic_match:
         hints_text = phonetic_match.group(1)
         # Extract percentages from hints: "10% Light, 50% Medium, 40% Far"
-        hints_match = re.search(r'(\d+)%\s+Light.*?(\d+)%\s+Medium.*?(\d+)%\s+Far', hints_text, re.I)
+        hints_match = _PHONETIC_HINTS_PCT_RE.search(hints_text)
         if hints_match:
             light_pct = int(hints_match.group(1)) / 100.0
             medium_pct = int(hints_match.group(2)) / 100.0
             far_pct = int(hints_match.group(3)) / 100.0
-            requirements['phonetic_similarity'] = {
+            return {
                 'Light': light_pct,
                 'Medium': medium_pct,
                 'Far': far_pct
             }
     
     # If not found in VALIDATION HINTS, try other patterns
-    if 'phonetic_similarity' not in requirements or not requirements['phonetic_similarity']:
-        phonetic_match = re.search(r'phonetic similarity.*?distribution.*?(\d+)%\s+Light.*?(\d+)%\s+Medium.*?(\d+)%\s+Far', query_template, re.I | re.DOTALL)
-        if not phonetic_match:
-            # Try alternative patterns
-            phonetic_match = re.search(r'phonetic similarity.*?(\d+)%\s+Light.*?(\d+)%\s+Medium.*?(\d+)%\s+Far', query_template, re.I | re.DOTALL)
-        if phonetic_match:
-            light_pct = int(phonetic_match.group(1)) / 100.0
-            medium_pct = int(phonetic_match.group(2)) / 100.0
-            far_pct = int(phonetic_match.group(3)) / 100.0
-            requirements['phonetic_similarity'] = {
-                'Light': light_pct,
-                'Medium': medium_pct,
-                'Far': far_pct
-            }
-        else:
-            # Fallback: check for simpler patterns
-            if 'phonetic similarity' in query_template.lower():
-                # Default to Medium if no specific distribution found
-                requirements['phonetic_similarity'] = {'Medium': 1.0}
+    phonetic_match = _PHONETIC_DIST_RE.search(query_lower, phonetic_at)
+    if not phonetic_match:
+        # Try alternative patterns
+        phonetic_match = _PHONETIC_ALT_RE.search(query_lower, phonetic_at)
+    if phonetic_match:
+        light_pct = int(phonetic_match.group(1)) / 100.0
+        medium_pct = int(phonetic_match.group(2)) / 100.0
+        far_pct = int(phonetic_match.group(3)) / 100.0
+        return {
+            'Light': light_pct,
+            'Medium': medium_pct,
+            'Far': far_pct
+        }
+    # Fallback: similarity is mentioned but no distribution was found - default to Medium
+    return {'Medium': 1.0}
+
+def _extract_orthographic_similarity(query_lower: str, hints_at: int):
+    """Extract the orthographic similarity distribution (Light/Medium/Far percentages)"""
+    # Every orthographic pattern starts from this phrase, so searches can begin at it
+    orthographic_at = query_lower.find('orthographic similarity')
+    if orthographic_at < 0:
+        return {}
     
-    # Extract orthographic similarity distribution (Light/Medium/Far percentages)
     # First try VALIDATION HINTS section (more reliable format)
-    orthographic_match = re.search(r'\[VALIDATION HINTS\].*?Orthographic similarity:\s*([^.;]+)', query_template, re.I | re.DOTALL)
+    orthographic_match = _ORTHOGRAPHIC_HINTS_RE.search(query_lower, hints_at) if hints_at >= 0 else None
     if orthographic_match:
         hints_text = orthographic_match.group(1)
         # Extract percentages from hints: "70% Light, 30% Medium" or "70% Light, 30% Medium, 0% Far"
-        hints_match = re.search(r'(\d+)%\s+Light.*?(\d+)%\s+Medium(?:.*?(\d+)%\s+Far)?', hints_text, re.I)
+        hints_match = _ORTHOGRAPHIC_HINTS_PCT_RE.search(hints_text)
         if hints_match:
             light_pct = int(hints_match.group(1)) / 100.0
             medium_pct = int(hints_match.group(2)) / 100.0
             far_pct = int(hints_match.group(3)) / 100.0 if hints_match.lastindex >= 3 and hints_match.group(3) else 0.0
-            requirements['orthographic_similarity'] = {
+            orthographic_sim = {
                 'Light': light_pct,
                 'Medium': medium_pct
             }
             if far_pct > 0:
-                requirements['orthographic_similarity']['Far'] = far_pct
+                orthographic_sim['Far'] = far_pct
+            return orthographic_sim
     
     # If not found in VALIDATION HINTS, try other patterns
-    if 'orthographic_similarity' not in requirements or not requirements['orthographic_similarity']:
-        orthographic_match = re.search(r'orthographic similarity.*?distribution.*?(\d+)%\s+Light.*?(\d+)%\s+Medium', query_template, re.I | re.DOTALL)
-        if not orthographic_match:
-            # Try alternative patterns (may include Far)
-            orthographic_match = re.search(r'orthographic similarity.*?(\d+)%\s+Light.*?(\d+)%\s+Medium(?:.*?(\d+)%\s+Far)?', query_template, re.I | re.DOTALL)
-        if orthographic_match:
-            light_pct = int(orthographic_match.group(1)) / 100.0
-            medium_pct = int(orthographic_match.group(2)) / 100.0
-            far_pct = int(orthographic_match.group(3)) / 100.0 if orthographic_match.lastindex >= 3 and orthographic_match.group(3) else 0.0
-            requirements['orthographic_similarity'] = {
-                'Light': light_pct,
-                'Medium': medium_pct
-            }
-            if far_pct > 0:
-                requirements['orthographic_similarity']['Far'] = far_pct
-        else:
-            # Fallback: check for simpler patterns
-            if 'orthographic similarity' in query_template.lower():
-                # Default to Medium if no specific distribution found
-                requirements['orthographic_similarity'] = {'Medium': 1.0}
-    
-    # Extract UAV seed name from Phase 3 requirements
-    uav_match = re.search(r'For the seed "([^"]+)" ONLY', query_template, re.I)
+    orthographic_match = _ORTHOGRAPHIC_DIST_RE.search(query_lower, orthographic_at)
+    if not orthographic_match:
+        # Try alternative patterns (may include Far)
+        orthographic_match = _ORTHOGRAPHIC_ALT_RE.search(query_lower, orthographic_at)
+    if orthographic_match:
+        light_pct = int(orthographic_match.group(1)) / 100.0
+        medium_pct = int(orthographic_match.group(2)) / 100.0
+        far_pct = int(orthographic_match.group(3)) / 100.0 if orthographic_match.lastindex >= 3 and orthographic_match.group(3) else 0.0
+        orthographic_sim = {
+            'Light': light_pct,
+            'Medium': medium_pct
+        }
+        if far_pct > 0:
+            orthographic_sim['Far'] = far_pct
+        return orthographic_sim
+    # Fallback: similarity is mentioned but no distribution was found - default to Medium
+    return {'Medium': 1.0}
+
+def _extract_similarities(query_lower: str):
+    """Extract (phonetic, orthographic) distributions, locating the shared hints section once"""
+    hints_at = query_lower.find('[validation hints]')
+    return (
+        _extract_phonetic_similarity(query_lower, hints_at),
+        _extract_orthographic_similarity(query_lower, hints_at),
+    )
+
+def _extract_uav_seed(query_template: str):
+    """Extract the Phase 3 UAV seed name - matched on the original template to keep the name's case"""
+    uav_match = _UAV_SEED_RE.search(query_template)
     if uav_match:
-        requirements['uav_seed_name'] = uav_match.group(1)
+        return uav_match.group(1)
+    return None
+
+@lru_cache(maxsize=256)
+def _parse_cached(query_template: str) -> tuple:
+    """Parse a template into frozen (key, value) pairs that can be shared between callers"""
+    requirements = {
+        'variation_count': 15,
+        'rule_percentage': 0,
+        'rules': (),
+        'phonetic_similarity': (),
+        'orthographic_similarity': (),
+        'uav_seed_name': None  # Phase 3: UAV seed name
+    }
+    
+    # Lower-case once; every extractor except the UAV one matches against this copy
+    query_lower = query_template.lower()
     
-    return requirements
\ No newline at end of file
+    # Each guard is a literal every pattern of that extractor needs, so skipping is exact.
+    # (Similarity extractors gate themselves; their Medium fallback needs no '%'.)
+    if 'variations' in query_lower:
+        variation_count = _extract_variation_count(query_lower)
+        if variation_count is not None:
+            requirements['variation_count'] = variation_count
+    if '%' in query_lower:
+        requirements['rule_percentage'] = _extract_rule_percentage(query_lower)
+    requirements['rules'] = _extract_rules(query_lower)
+    phonetic_similarity, orthographic_similarity = _extract_similarities(query_lower)
+    requirements['phonetic_similarity'] = tuple(phonetic_similarity.items())
+    requirements['orthographic_similarity'] = tuple(orthographic_similarity.items())
+    if 'only' in query_lower:
+        requirements['uav_seed_name'] = _extract_uav_seed(query_template)
+    
+    return tuple(requirements.items())
+
+def parse_query_template(query_template: str):
+    """Extract requirements from query template (validators resend the same template, so parses are cached)"""
+    requirements = dict(_parse_cached(query_template))
+    # Fresh containers so callers can mutate the result without touching the cache
+    requirements['rules'] = list(requirements['rules'])
+    requirements['phonetic_similarity'] = dict(requirements['phonetic_similarity'])
+    requirements['orthographic_similarity'] = dict(requirements['orthographic_similarity'])
+    return requirements
@@ -66,6 +66,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # from dob.dob import generate_dob_variations
 # from address.address import generate_address_variations
 
+# Import the working variation generator (split into modules under main/).
+# MIID_VERBOSE=0 skips the per-request synapse dump and per-name result lines.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main'))
+from _index import generate_variations as generate_variations_clean, VERBOSE
+
 # Optional imports for detailed metrics calculation
 try:
     import jellyfish
@@ -170,16 +175,12 @@ class Miner(BaseMinerNeuron):
         
         # Get timeout from synapse (default to 120s if not specified)
         timeout = getattr(synapse, 'timeout', 120.0)
-        print("*" * 80)
-        print(synapse)
-        print("*" * 80)
+        if VERBOSE:
+            print("*" * 80)
+            print(synapse)
+            print("*" * 80)
         try:
             
-            # Import the working variation generator (now split into modules)
-            sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'main'))
-            from _index import generate_variations as generate_variations_clean
-            
-            
             # Use the proven generator that works
             bt.logging.info("🔄 USING PROVEN VARIATION GENERATOR")
             variations = generate_variations_clean(synapse)
@@ -190,23 +191,21 @@ class Miner(BaseMinerNeuron):
             # Log results
             total_time = time.time() - start_time
             
-            # Calculate total variations (handle both regular and UAV formats)
+            # Count total variations (handle both regular and UAV formats) and log
+            # the final per-name counts in the same pass; those lines are verbose-only
             total_variations = 0
+            if VERBOSE:
+                bt.logging.info("🎯 FINAL VARIATIONS BEING RETURNED:")
             if isinstance(variations, dict):
                 for name, name_variations in variations.items():
                     if isinstance(name_variations, list):
                         total_variations += len(name_variations)
+                        if VERBOSE:
+                            bt.logging.info(f"   • {name}: {len(name_variations)} variations")
                     elif isinstance(name_variations, dict) and 'variations' in name_variations:
                         total_variations += len(name_variations['variations'])
-            
-            # CRITICAL: Log final variations being returned
-            bt.logging.info("🎯 FINAL VARIATIONS BEING RETURNED:")
-            if isinstance(variations, dict):
-                for name, name_variations in variations.items():
-                    if isinstance(name_variations, list):
-                        bt.logging.info(f"   • {name}: {len(name_variations)} variations")
-                    elif isinstance(name_variations, dict) and 'variations' in name_variations:
-                        bt.logging.info(f"   • {name}: {len(name_variations['variations'])} variations (UAV format)")
+                        if VERBOSE:
+                            bt.logging.info(f"   • {name}: {len(name_variations['variations'])} variations (UAV format)")
                     else:
                         bt.logging.error(f"   • {name}: Unknown format")
             
@@ -36,6 +36,13 @@ try:
 except ImportError:
     JELLYFISH_AVAILABLE = False
 
+# orjson encodes the (non-ASCII heavy) result JSON much faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import unidecode for transliteration
 try:
     from unidecode import unidecode
@@ -2454,8 +2461,13 @@ def main():
     
     # If output file specified, save it
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # orjson writes UTF-8 bytes directly (same as ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
         print(f"\n💾 Saved to: {output_file}")
         print(f"   Format: Miner response format (synapse.variations)")
     else:
@@ -222,20 +222,22 @@ class Validator(BaseValidatorNeuron):
             if m and m not in all_models:
                 all_models.append(m)
         
+        # List local models once and check every model against that snapshot
+        try:
+            local_models = {self._get_model_name_from_response(model_data) for model_data in ollama.list()['models']}
+        except Exception as e:
+            bt.logging.error(f"Failed to list local Ollama models: {e}")
+            return
+        
         for model_name in all_models:
             try:
                 bt.logging.info(f"Checking if model '{model_name}' is available locally.")
-                response = ollama.list()
-                
-                model_is_pulled = False
-                for model_data in response['models']:
-                    if self._get_model_name_from_response(model_data) == model_name:
-                        model_is_pulled = True
-                        break
+                model_is_pulled = model_name in local_models
 
                 if not model_is_pulled:
                     bt.logging.info(f"Model '{model_name}' not found locally. Pulling now...")
                     ollama.pull(model_name)
+                    local_models.add(model_name)
                     bt.logging.info(f"Successfully pulled model '{model_name}'.")
                 else:
                     bt.logging.info(f"Model '{model_name}' is already available.")